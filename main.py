@@ -5,16 +5,36 @@ A comprehensive MCP server with structured output for all Google Drive API v3 en
 Uses Nango for authentication.
 """
 
-import json
+import asyncio
 import os
+import random
+import re
 import sys
-from typing import Dict, List, Optional, Any, Union
+import time
+import uuid
+from collections import OrderedDict
+from contextvars import ContextVar, copy_context
+from datetime import datetime, timezone
+from email import policy
+from email.parser import BytesParser
+from functools import lru_cache
+from urllib.parse import quote, urlencode
+from types import MappingProxyType, TracebackType
+from typing import Any, Coroutine, Dict, List, Mapping, NotRequired, Optional, Set, TypedDict, Union
 from dataclasses import dataclass
-from pydantic import BaseModel, Field
-import requests
+from pydantic import BaseModel, Field, SecretStr, TypeAdapter, ValidationError
+from pydantic_core import from_json, to_json
+from pydantic_settings import BaseSettings, SettingsConfigDict
+import httpx
+import uvicorn
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
 
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:
+    redis_asyncio = None
+
 load_dotenv(override=True)
 
 # Initialize FastMCP server
@@ -23,50 +43,178 @@ mcp = FastMCP("Google Drive API v3")
 # Base URL for Google Drive API
 BASE_URL = "https://www.googleapis.com"
 
-# Global variable to cache access token
-_cached_access_token = None
+# Endpoint path templates, filled in with resource ids by drive_path
+ACCESS_PROPOSALS_PATH = "/drive/v3/files/{}/accessproposals"
+ACCESS_PROPOSAL_PATH = "/drive/v3/files/{}/accessproposals/{}"
+ACCESS_PROPOSAL_RESOLVE_PATH = "/drive/v3/files/{}/accessproposals/{}:resolve"
+APP_PATH = "/drive/v3/apps/{}"
+COMMENTS_PATH = "/drive/v3/files/{}/comments"
+COMMENT_PATH = "/drive/v3/files/{}/comments/{}"
+DRIVE_PATH = "/drive/v3/drives/{}"
+DRIVE_HIDE_PATH = "/drive/v3/drives/{}/hide"
+DRIVE_UNHIDE_PATH = "/drive/v3/drives/{}/unhide"
+FILE_PATH = "/drive/v3/files/{}"
+FILE_COPY_PATH = "/drive/v3/files/{}/copy"
+FILE_DOWNLOAD_PATH = "/drive/v3/files/{}/download"
+FILE_EXPORT_PATH = "/drive/v3/files/{}/export"
+FILE_LIST_LABELS_PATH = "/drive/v3/files/{}/listLabels"
+FILE_MODIFY_LABELS_PATH = "/drive/v3/files/{}/modifyLabels"
+FILE_UPLOAD_PATH = "/upload/drive/v3/files/{}"
+FILE_WATCH_PATH = "/drive/v3/files/{}/watch"
+OPERATION_PATH = "/drive/v3/operations/{}"
+OPERATIONS_PREFIX = "/drive/v3/operations/"
+PERMISSIONS_PATH = "/drive/v3/files/{}/permissions"
+PERMISSION_PATH = "/drive/v3/files/{}/permissions/{}"
+REPLIES_PATH = "/drive/v3/files/{}/comments/{}/replies"
+REPLY_PATH = "/drive/v3/files/{}/comments/{}/replies/{}"
+REVISIONS_PATH = "/drive/v3/files/{}/revisions"
+REVISION_PATH = "/drive/v3/files/{}/revisions/{}"
+
+@lru_cache(maxsize=4096)
+def quote_path_segment(value: str) -> str:
+    """URL-encode a resource id so it stays a single path segment"""
+    return quote(value, safe="")
+
+def drive_path(template: str, *ids: str) -> str:
+    """Build an endpoint path from a template and URL-encoded resource ids"""
+    return template.format(*map(quote_path_segment, ids))
+
+# Global variables to cache access token and its refresh deadline
+# (time.monotonic() seconds, None when Nango reports no expiry)
+_cached_access_token: Optional[str] = None
+_access_token_deadline: Optional[float] = None
+_access_token_lock = asyncio.Lock()
+
+# Refresh this many seconds before Nango's reported expiry
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+# Shared async HTTP client, created lazily on the server's event loop. Every
+# tool call reuses its pooled HTTP/2 connections to www.googleapis.com
+# instead of paying a fresh TCP + TLS handshake per request. Concurrent calls
+# are multiplexed as streams on the same connection, so a handful of
+# connections is enough.
+_http_client: Optional[httpx.AsyncClient] = None
+HTTP_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=8)
+
+# Sent with every request; set once on the client rather than per call
+HTTP_DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip",
+    "User-Agent": "google-drive-mcp/0.1.0 (gzip)"
+}
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client, creating it on first use"""
+    global _http_client
+    
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=HTTP_LIMITS,
+            headers=HTTP_DEFAULT_HEADERS,
+            timeout=30
+        )
+    
+    return _http_client
+
+class NangoConfig(BaseSettings):
+    """Nango connection settings, read from NANGO_* environment variables"""
+    model_config = SettingsConfigDict(env_prefix="NANGO_", frozen=True)
+    
+    connection_id: str
+    integration_id: str
+    base_url: str
+    secret_key: SecretStr
+
+@lru_cache(maxsize=1)
+def get_nango_config() -> NangoConfig:
+    """Get Nango settings, loading and validating them once"""
+    return NangoConfig()
 
-def get_connection_credentials() -> dict[str, Any]:
+async def get_connection_credentials() -> dict[str, Any]:
     """Get credentials from Nango"""
-
-    id = os.environ.get("NANGO_CONNECTION_ID")
-    integration_id = os.environ.get("NANGO_INTEGRATION_ID")
-    base_url = os.environ.get("NANGO_BASE_URL")
-    secret_key = os.environ.get("NANGO_SECRET_KEY")
+    config = get_nango_config()
     
-    url = f"{base_url}/connection/{id}"
+    url = f"{config.base_url}/connection/{config.connection_id}"
     params = {
-        "provider_config_key": integration_id,
+        "provider_config_key": config.integration_id,
         "refresh_token": "true",
     }
-    headers = {"Authorization": f"Bearer {secret_key}"}
+    headers = {"Authorization": f"Bearer {config.secret_key.get_secret_value()}"}
     
-    response = requests.get(url, headers=headers, params=params)
+    response = await get_http_client().get(url, headers=headers, params=params)
     response.raise_for_status()  # Raise exception for bad status codes
     
-    return response.json()
+    return from_json(response.content)
 
-def get_access_token() -> str:
-    """Get access token from Nango, with caching"""
-    global _cached_access_token
-    
-    if _cached_access_token is None:
-        credentials = get_connection_credentials()
-        _cached_access_token = credentials.get("credentials", {}).get("access_token")
-        
-        if not _cached_access_token:
-            raise ValueError("No access token found in Nango credentials")
+def get_token_deadline(expires_at: Optional[str]) -> Optional[float]:
+    """Convert Nango's ISO expires_at into a monotonic refresh deadline"""
+    if not expires_at:
+        return None
+    try:
+        expiry = datetime.fromisoformat(expires_at)
+    except ValueError:
+        return None
+    if expiry.tzinfo is None:
+        expiry = expiry.replace(tzinfo=timezone.utc)
     
-    return _cached_access_token
+    remaining = (expiry - datetime.now(timezone.utc)).total_seconds()
+    return time.monotonic() + remaining - TOKEN_REFRESH_MARGIN_SECONDS
 
-def refresh_access_token() -> str:
-    """Force refresh access token from Nango"""
-    global _cached_access_token
-    _cached_access_token = None
-    return get_access_token()
+def is_access_token_fresh() -> bool:
+    """Check whether the cached access token can still be used"""
+    if _cached_access_token is None:
+        return False
+    return _access_token_deadline is None or time.monotonic() < _access_token_deadline
+
+async def fetch_access_token() -> str:
+    """Fetch a new access token from Nango and cache it; callers hold the token lock"""
+    global _cached_access_token, _access_token_deadline
+    
+    credentials = (await get_connection_credentials()).get("credentials", {})
+    access_token = credentials.get("access_token")
+    
+    if not access_token:
+        raise ValueError("No access token found in Nango credentials")
+    
+    _cached_access_token = access_token
+    _access_token_deadline = get_token_deadline(credentials.get("expires_at"))
+    return access_token
+
+async def get_access_token() -> str:
+    """Get access token from Nango, with caching and refresh ahead of expiry"""
+    if _cached_access_token is not None and is_access_token_fresh():
+        return _cached_access_token
+    
+    # Only one caller fetches from Nango, the rest reuse its token
+    async with _access_token_lock:
+        if _cached_access_token is not None and is_access_token_fresh():
+            return _cached_access_token
+        return await fetch_access_token()
+
+@lru_cache(maxsize=64)
+def auth_headers(access_token: str) -> Mapping[str, str]:
+    """Get the read-only Authorization header for a token, built once per token"""
+    return MappingProxyType({"Authorization": f"Bearer {access_token}"})
+
+async def refresh_access_token(rejected_token: Optional[str] = None) -> str:
+    """Force refresh access token from Nango.
+
+    When several requests are rejected with the same token at once, only the
+    first refreshes; the rest pick up the token it fetched.
+    """
+    async with _access_token_lock:
+        token = _cached_access_token
+        if rejected_token is not None and token is not None and token != rejected_token and is_access_token_fresh():
+            return token
+        return await fetch_access_token()
 
 # Structured output models
-class APIResponse(BaseModel):
+# A plain dataclass rather than a BaseModel: it's built on every request from
+# already-parsed response data, so pydantic validation would only add overhead.
+# No __slots__, since FastMCP reads the field defaults off the class to build
+# the tools' output schema.
+@dataclass
+class APIResponse:
     """Standard API response structure"""
     success: bool
     status_code: int
@@ -196,200 +344,1119 @@ class Operation(BaseModel):
     error: Optional[Dict[str, Any]] = None
     response: Optional[Dict[str, Any]] = None
 
+# List validators built once, so each page is validated in a single
+# pydantic-core pass instead of one model constructor call per item
+_ACCESS_PROPOSALS_ADAPTER = TypeAdapter(List[AccessProposal])
+_APPS_ADAPTER = TypeAdapter(List[App])
+_CHANGES_ADAPTER = TypeAdapter(List[Change])
+_COMMENTS_ADAPTER = TypeAdapter(List[Comment])
+_DRIVES_ADAPTER = TypeAdapter(List[Drive])
+_FILES_ADAPTER = TypeAdapter(List[FileMetadata])
+_PERMISSIONS_ADAPTER = TypeAdapter(List[Permission])
+_REPLIES_ADAPTER = TypeAdapter(List[Reply])
+_REVISIONS_ADAPTER = TypeAdapter(List[Revision])
+
+class PermissionPage(TypedDict):
+    """Raw permissions.list response body"""
+    permissions: NotRequired[List[Permission]]
+    nextPageToken: NotRequired[str]
+
+class ReplyPage(TypedDict):
+    """Raw replies.list response body"""
+    replies: NotRequired[List[Reply]]
+    nextPageToken: NotRequired[str]
+
+class RevisionPage(TypedDict):
+    """Raw revisions.list response body"""
+    revisions: NotRequired[List[Revision]]
+    nextPageToken: NotRequired[str]
+
+# Page decoders for make_api_request: the list endpoints on the hottest paths
+# are validated from the response bytes in one pydantic-core pass, so no dict
+# per item is built only to be converted into a model afterwards. The list
+# adapters above then pass the already-built models through unchanged.
+# APIResponse.data then holds models rather than dicts for these keys; batch
+# parts and Redis hits, which arrive as dicts, are validated into the same
+# shape so a cache key never holds both.
+_PERMISSION_PAGE_ADAPTER = TypeAdapter(PermissionPage)
+_REPLY_PAGE_ADAPTER = TypeAdapter(ReplyPage)
+_REVISION_PAGE_ADAPTER = TypeAdapter(RevisionPage)
+
+# Default partial-response masks for list tools, mirroring the fields of the
+# structured output models so Drive doesn't serialize (and we don't parse)
+# anything that would be dropped anyway. Tools accept fields to override.
+_FILE_FIELDS = "id,name,mimeType,parents,createdTime,modifiedTime,size,webViewLink,webContentLink"
+_AUTHOR_FIELDS = "author(displayName,photoLink)"
+DEFAULT_APP_LIST_FIELDS = "apps(id,name,productName,authorized)"
+DEFAULT_CHANGE_LIST_FIELDS = f"nextPageToken,newStartPageToken,changes(changeType,fileId,time,file({_FILE_FIELDS}))"
+DEFAULT_COMMENT_LIST_FIELDS = f"nextPageToken,comments(id,content,{_AUTHOR_FIELDS},createdTime,modifiedTime)"
+DEFAULT_DRIVE_LIST_FIELDS = "nextPageToken,drives(id,name,createdTime,capabilities)"
+DEFAULT_FILE_LIST_FIELDS = f"nextPageToken,incompleteSearch,files({_FILE_FIELDS})"
+DEFAULT_PERMISSION_LIST_FIELDS = "nextPageToken,permissions(id,type,role,emailAddress,displayName)"
+DEFAULT_REPLY_LIST_FIELDS = f"nextPageToken,replies(id,content,{_AUTHOR_FIELDS},createdTime,modifiedTime)"
+DEFAULT_REVISION_LIST_FIELDS = "nextPageToken,revisions(id,mimeType,modifiedTime,size)"
+
+class SubRequest(BaseModel):
+    """Single Drive API call inside a batch request"""
+    method: str
+    endpoint: str
+    params: Optional[Dict[str, Any]] = None
+    json_data: Optional[Dict[str, Any]] = None
+
+class PermissionCreate(BaseModel):
+    """Permission to create on a file, as one entry of a bulk create"""
+    file_id: str
+    role: str
+    type: str
+    email_address: Optional[str] = None
+    domain: Optional[str] = None
+    email_message: Optional[str] = None
+    send_notification_email: Optional[bool] = None
+    supports_all_drives: Optional[bool] = None
+    transfer_ownership: Optional[bool] = None
+
+class BatchResponse(BaseModel):
+    """Batch response structure, one entry per sub-request in order"""
+    responses: List[APIResponse] = Field(default_factory=list)
+
+class ToolCall(BaseModel):
+    """Tool invocation inside a batch of tool calls"""
+    name: str
+    arguments: Dict[str, Any] = Field(default_factory=dict)
+
+class ToolCallResult(BaseModel):
+    """Result of one tool invocation inside a batch of tool calls"""
+    name: str
+    result: Optional[Any] = None
+    error: Optional[str] = None
+
+class ToolCallResultList(BaseModel):
+    """Batch of tool call results, one entry per call in order"""
+    results: List[ToolCallResult] = Field(default_factory=list)
+
+# Drive API batch endpoint, taking multipart/mixed bodies of sub-requests
+BATCH_PATH = "/batch/drive/v3"
+
+# Drive accepts up to 100 calls per batch, but large batches are prone to
+# backend 500s, so sub-requests are split into smaller batches
+BATCH_MAX_SIZE = 25
+
+def encode_query_params(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Drop unset query params and spell booleans as Google APIs expect ("true"/"false")"""
+    return {
+        key: ("true" if value else "false") if isinstance(value, bool) else value
+        for key, value in (params or {}).items()
+        if value is not None
+    }
+
+def encode_batch_body(sub_requests: List[SubRequest], boundary: str) -> bytes:
+    """Serialize sub-requests into a multipart/mixed batch request body"""
+    parts = []
+    for index, sub_request in enumerate(sub_requests):
+        path = sub_request.endpoint
+        query = encode_query_params(sub_request.params)
+        if query:
+            path = f"{path}?{httpx.QueryParams(query)}"
+        
+        lines = [
+            f"--{boundary}",
+            "Content-Type: application/http",
+            f"Content-ID: <{index}>",
+            "",
+            f"{sub_request.method.upper()} {path} HTTP/1.1",
+        ]
+        if sub_request.json_data is not None:
+            lines += ["Content-Type: application/json; charset=UTF-8", "", to_json(sub_request.json_data).decode()]
+        else:
+            lines.append("")
+        parts.append("\r\n".join(lines))
+    
+    parts.append(f"--{boundary}--")
+    return "\r\n".join(parts).encode()
+
+def parse_batch_response(content_type: str, content: bytes) -> List[Dict[str, Any]]:
+    """Parse a multipart/mixed batch response into APIResponse fields, in Content-ID order"""
+    message = BytesParser(policy=policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + content
+    )
+    
+    responses = []
+    for position, part in enumerate(message.iter_parts()):
+        # Content-ID comes back as <response-N> for the request sent as <N>
+        content_id = part.get("Content-ID", "").strip("<>").removeprefix("response-")
+        index = int(content_id) if content_id.isdigit() else position
+        
+        payload = part.get_payload(decode=True)
+        if not isinstance(payload, bytes):
+            payload = b""
+        status_line, _, rest = payload.partition(b"\r\n")
+        _, _, body = rest.partition(b"\r\n\r\n")
+        _, status, reason = (status_line.decode().split(" ", 2) + ["", ""])[:3]
+        status_code = int(status) if status.isdigit() else 0
+        success = 200 <= status_code < 300
+        
+        body_data = None
+        if body.strip():
+            try:
+                body_data = from_json(body)
+            except ValueError:
+                body_data = {"content": body.decode(errors="replace")}
+        
+        responses.append((index, {
+            "success": success,
+            "status_code": status_code,
+            "data": body_data,
+            "error": None if success else f"HTTP {status_code}: {reason.strip()}"
+        }))
+    
+    return [fields for _, fields in sorted(responses, key=lambda item: item[0])]
+
+class TokenBucket:
+    """Async token bucket that spaces out requests to stay under a rate limit"""
+    
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+# Server transport, and worker processes for the streamable HTTP transport.
+# Each worker has its own interpreter, so parsing and validating large
+# responses isn't serialized on one GIL; stdio always runs in one process.
+MCP_TRANSPORT = os.environ.get("MCP_TRANSPORT", "stdio")
+MCP_WORKERS = int(os.environ.get("MCP_WORKERS", "1"))
+if MCP_WORKERS < 1:
+    raise ValueError(f"MCP_WORKERS must be at least 1, got {MCP_WORKERS}")
+
+# Outbound request shaping, kept just under Drive's per-user quotas so bursts
+# queue locally instead of coming back as 429s. Writes have a tighter quota.
+# Every worker process has its own buckets, so the quota is split between them;
+# a bucket always holds at least one token, or a slow rate could never fill it.
+READ_REQUESTS_PER_SECOND = float(os.environ.get("DRIVE_READ_REQUESTS_PER_SECOND", "20"))
+WRITE_REQUESTS_PER_SECOND = float(os.environ.get("DRIVE_WRITE_REQUESTS_PER_SECOND", "8"))
+RATE_LIMIT_WORKERS = MCP_WORKERS if MCP_TRANSPORT == "streamable-http" else 1
+WORKER_READ_RATE = READ_REQUESTS_PER_SECOND / RATE_LIMIT_WORKERS
+WORKER_WRITE_RATE = WRITE_REQUESTS_PER_SECOND / RATE_LIMIT_WORKERS
+_read_limiter = TokenBucket(WORKER_READ_RATE, max(1.0, WORKER_READ_RATE))
+_write_limiter = TokenBucket(WORKER_WRITE_RATE, max(1.0, WORKER_WRITE_RATE))
+
+# Rate-limit and overload responses are retried with exponential backoff.
+# Drive also reports quota exhaustion as a 403 with one of these reasons.
+RETRY_STATUS_CODES = {429, 503}
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+MAX_RETRIES = 4
+MAX_BACKOFF_SECONDS = 32.0
+
+def get_rate_limiter(method: str) -> TokenBucket:
+    """Get the token bucket for an HTTP method"""
+    return _read_limiter if method.upper() in ("GET", "HEAD") else _write_limiter
+
+def get_backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number attempt (from 0), with jitter"""
+    return min(2 ** attempt + random.random(), MAX_BACKOFF_SECONDS)
+
+def get_retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring Retry-After when present"""
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), MAX_BACKOFF_SECONDS)
+    return get_backoff_delay(attempt)
+
+def is_rate_limited(response: APIResponse) -> bool:
+    """Check whether a response asks to retry later because of rate limits or overload"""
+    if response.status_code in RETRY_STATUS_CODES:
+        return True
+    if response.status_code != 403 or not response.data:
+        return False
+    
+    errors = (response.data.get("error") or {}).get("errors") or []
+    return any(error.get("reason") in RATE_LIMIT_REASONS for error in errors)
+
+# Non text/* media types whose bodies are returned as text
+TEXT_MEDIA_TYPES = {
+    "application/xml",
+    "application/javascript",
+    "application/x-javascript",
+    "application/rtf",
+    "image/svg+xml",
+}
+
+def decode_response_body(
+    response: httpx.Response,
+    decoder: Optional[TypeAdapter[Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """Decode a response body according to its Content-Type, using decoder for JSON when given"""
+    if not response.content:
+        return None
+    
+    content_type = response.headers.get("Content-Type", "")
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    
+    if media_type == "multipart/mixed":
+        return {"responses": parse_batch_response(content_type, response.content)}
+    if media_type == "application/json" or media_type.endswith("+json"):
+        if decoder is not None:
+            try:
+                return decoder.validate_json(response.content)
+            except ValidationError:
+                # Fall back to plain JSON so the caller's own validation
+                # reports the mismatch instead of it passing as empty text
+                pass
+        try:
+            return from_json(response.content)
+        except ValueError:
+            return {"content": response.text}
+    if media_type.startswith("text/") or media_type in TEXT_MEDIA_TYPES:
+        return {"content": response.text}
+    
+    # Binary payloads aren't decoded; use destination_path to save them
+    return {"contentType": content_type, "size": len(response.content)}
+
+def apply_decoder(response: APIResponse, decoder: Optional[TypeAdapter[Any]]) -> APIResponse:
+    """Validate a successful response's already-parsed data into the decoder's shape"""
+    if decoder is None or not response.success or not response.data:
+        return response
+    try:
+        response.data = decoder.validate_python(response.data)
+    except ValidationError:
+        # Keep the plain data, as decode_response_body does for bad bodies
+        pass
+    return response
+
+def should_retry(response: httpx.Response) -> bool:
+    """Check whether an HTTP response is a rate-limit or overload error worth retrying"""
+    # Only a 403 needs its body to tell a quota error from a permission error
+    data = decode_response_body(response) if response.status_code == 403 else None
+    return is_rate_limited(APIResponse(success=False, status_code=response.status_code, data=data))
+
+# Mutations under /drive/v3/files/{fileId} only invalidate that file's cached
+# responses (plus unscoped ones such as files.list); these segments are
+# collection actions rather than file ids
+FILE_SCOPED_ENDPOINT = re.compile(r"^(?:/upload)?/drive/v3/files/([^/?:]+)")
+FILE_COLLECTION_SEGMENTS = {"generateIds", "trash"}
+
+# Idempotent GETs opted in with cache_ttl are served from the cache for that
+# many seconds, then for one more TTL as stale data while a background request
+# revalidates them with If-None-Match, so an unchanged resource costs a
+# bodiless 304 instead of a full response. Mutable sharing state gets a short
+# TTL; slow-changing metadata a long one.
+CACHE_TTL_SHORT = 5
+CACHE_TTL_NORMAL = 30
+CACHE_TTL_LONG = 60
+
+# Set REDIS_URL to share the cache across workers; entries outlive their TTL
+# by RESPONSE_CACHE_RETENTION seconds so they can still be revalidated
+REDIS_URL = os.environ.get("REDIS_URL")
+RESPONSE_CACHE_SIZE = 1024
+RESPONSE_CACHE_RETENTION = 3600
+
+# Callers that opt in with stale_if_error keep getting the last known response
+# through API outages, for at most this many seconds past its stale deadline
+STALE_IF_ERROR_SECONDS = 300
+
+@dataclass
+class CacheEntry:
+    """Cached GET response with its ETag and fresh/stale deadlines (epoch seconds)"""
+    response: APIResponse
+    etag: Optional[str]
+    fresh_until: float
+    stale_until: float
+
+def get_cache_scope(endpoint: str) -> Optional[str]:
+    """Get the file id a request endpoint belongs to, or None if it isn't file-scoped"""
+    match = FILE_SCOPED_ENDPOINT.match(endpoint)
+    if match is None or match.group(1) in FILE_COLLECTION_SEGMENTS:
+        return None
+    return match.group(1)
+
+def make_cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Build a cache key prefixed with the endpoint's file scope ('-' when unscoped)"""
+    query = urlencode(sorted(params.items()))
+    return f"{get_cache_scope(endpoint) or '-'}:{endpoint}?{query}"
+
+class ResponseCache:
+    """In-process LRU cache of GET responses with per-entry TTLs"""
+    
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+    
+    async def lookup(self, key: str, decoder: Optional[TypeAdapter[Any]] = None) -> Optional[CacheEntry]:
+        """Get an entry, fresh or stale, marking it recently used.
+
+        Entries are stored as fetched, so their data already has the decoder's shape.
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+    
+    async def store(self, key: str, response: APIResponse, etag: Optional[str], ttl: float) -> None:
+        """Store a response, evicting the least recently used entries"""
+        fresh_until = time.time() + ttl
+        self.entries[key] = CacheEntry(response, etag, fresh_until, fresh_until + ttl)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+    
+    async def invalidate(self, scopes: Optional[Set[str]]) -> None:
+        """Drop entries for the given files plus every unscoped entry, or everything when scopes is None"""
+        if scopes is None:
+            self.entries.clear()
+            return
+        
+        for key in [key for key in self.entries if is_invalidated(key, scopes)]:
+            del self.entries[key]
+
+def is_invalidated(key: str, scopes: Set[str]) -> bool:
+    """Check whether a cache key is dropped when the given files change"""
+    scope = key.partition(":")[0]
+    return scope == "-" or scope in scopes
+
+class RedisResponseCache:
+    """Redis-backed cache of GET responses, shared across server processes.
+
+    Each file scope ('-' for unscoped entries) keeps a Redis set of its cache
+    keys, so invalidating a file deletes just its entries instead of scanning
+    the keyspace. The scopes in use are themselves listed in one more set.
+    """
+    
+    def __init__(self, url: str, prefix: str = "google-drive-mcp:") -> None:
+        self.client = redis_asyncio.from_url(url)
+        self.prefix = prefix
+        self.scopes_key = f"{prefix}index"
+    
+    def index_key(self, scope: str) -> str:
+        """Get the Redis set listing the cache keys under a file scope"""
+        return f"{self.scopes_key}:{scope}"
+    
+    async def lookup(self, key: str, decoder: Optional[TypeAdapter[Any]] = None) -> Optional[CacheEntry]:
+        """Get an entry, fresh or stale, with its data validated by decoder.
+
+        Redis errors and corrupt entries count as a miss.
+        """
+        try:
+            payload = await self.client.get(self.prefix + key)
+        except redis_asyncio.RedisError:
+            return None
+        if payload is None:
+            return None
+        
+        try:
+            entry = from_json(payload)
+            return CacheEntry(
+                apply_decoder(APIResponse(**entry["response"]), decoder),
+                entry["etag"],
+                entry["fresh_until"],
+                entry["stale_until"]
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
+    
+    async def store(self, key: str, response: APIResponse, etag: Optional[str], ttl: float) -> None:
+        """Store a response, kept past its TTL for ETag revalidation"""
+        fresh_until = time.time() + ttl
+        payload = to_json({
+            "response": response,
+            "etag": etag,
+            "fresh_until": fresh_until,
+            "stale_until": fresh_until + ttl
+        })
+        # The index sets expire with their newest entry; an entry they outlive
+        # is past its stale deadline and only ever revalidated, never served
+        expiry = int(2 * ttl) + RESPONSE_CACHE_RETENTION
+        scope = key.partition(":")[0]
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.set(self.prefix + key, payload, ex=expiry)
+                pipe.sadd(self.index_key(scope), key)
+                pipe.expire(self.index_key(scope), expiry)
+                pipe.sadd(self.scopes_key, scope)
+                pipe.expire(self.scopes_key, expiry)
+                await pipe.execute()
+        except redis_asyncio.RedisError:
+            pass
+    
+    async def invalidate(self, scopes: Optional[Set[str]]) -> None:
+        """Drop entries for the given files plus every unscoped entry, or everything when scopes is None"""
+        try:
+            if scopes is None:
+                scopes = {scope.decode() for scope in await self.client.smembers(self.scopes_key)}
+            scopes = scopes | {"-"}
+            
+            async with self.client.pipeline(transaction=False) as pipe:
+                for scope in scopes:
+                    pipe.smembers(self.index_key(scope))
+                members = await pipe.execute()
+            
+            # Remove only the members read here, so keys indexed meanwhile stay
+            async with self.client.pipeline(transaction=False) as pipe:
+                for scope, keys in zip(scopes, members):
+                    if keys:
+                        pipe.delete(*(self.prefix + key.decode() for key in keys))
+                        pipe.srem(self.index_key(scope), *keys)
+                await pipe.execute()
+        except redis_asyncio.RedisError:
+            pass
+
+def create_response_cache() -> Union[ResponseCache, RedisResponseCache]:
+    """Use Redis when REDIS_URL is set, otherwise an in-process cache"""
+    if not REDIS_URL:
+        return ResponseCache(RESPONSE_CACHE_SIZE)
+    if redis_asyncio is None:
+        raise ImportError("REDIS_URL is set but redis is not installed; install google-drive-mcp[redis]")
+    return RedisResponseCache(REDIS_URL)
+
+_response_cache = create_response_cache()
+
+# In-flight cache refreshes by key, so concurrent misses share one request
+_cache_refreshes: Dict[str, "asyncio.Task[APIResponse]"] = {}
+
 # Helper function to make API requests
-def make_api_request(
+async def make_api_request(
     method: str,
     endpoint: str,
-    headers: Optional[Dict[str, str]] = None,
+    headers: Optional[Mapping[str, str]] = None,
     params: Optional[Dict[str, Any]] = None,
     json_data: Optional[Dict[str, Any]] = None,
-    data: Optional[Any] = None,
-    retry_auth: bool = True
+    data: Optional[bytes] = None,
+    retry_auth: bool = True,
+    cache_ttl: Optional[float] = None,
+    decoder: Optional[TypeAdapter[Any]] = None,
+    stale_if_error: bool = False
 ) -> APIResponse:
-    """Make HTTP request to Google Drive API with automatic token refresh"""
+    """Make HTTP request to Google Drive API with automatic token refresh.
+
+    Pass a decoder to validate a successful JSON body straight from the raw
+    bytes into typed data, skipping the intermediate dicts. Cached GETs with
+    stale_if_error fall back to a recently expired entry when the API fails.
+    """
+    params = encode_query_params(params)
+    
+    if cache_ttl and method.upper() == "GET":
+        return await make_cached_request(endpoint, headers, params, cache_ttl, decoder, stale_if_error)
+    
+    api_response, _ = await send_api_request(method, endpoint, headers, params, json_data, data, retry_auth, decoder=decoder)
+    
+    if method.upper() != "GET" and api_response.success:
+        # A successful write may change the file it targets and any listing
+        scope = get_cache_scope(endpoint)
+        await _response_cache.invalidate({scope} if scope is not None else None)
+    
+    return api_response
+
+async def make_cached_request(
+    endpoint: str,
+    headers: Optional[Mapping[str, str]],
+    params: Dict[str, Any],
+    ttl: float,
+    decoder: Optional[TypeAdapter[Any]],
+    stale_if_error: bool
+) -> APIResponse:
+    """Serve a GET from the response cache, refreshing it at most once at a time per key.
+
+    Fresh entries are returned as is. Stale entries are returned immediately
+    while a background task revalidates them. On a miss, concurrent callers
+    share a single in-flight request instead of each hitting the API.
+    """
+    key = make_cache_key(endpoint, params)
+    entry = await _response_cache.lookup(key, decoder)
+    now = time.time()
+    
+    if entry is not None and now < entry.fresh_until:
+        return entry.response
+    
+    if entry is not None and now < entry.stale_until:
+        if key not in _cache_refreshes:
+            start_cache_refresh(key, endpoint, headers, params, ttl, entry, decoder, stale_if_error)
+        return entry.response
+    
+    if _active_batch.get() is not None:
+        # Fetch in this task so the request joins the caller's batch
+        return await refresh_cache_entry(key, endpoint, headers, params, ttl, entry, decoder, stale_if_error)
+    
+    refresh = _cache_refreshes.get(key) or start_cache_refresh(key, endpoint, headers, params, ttl, entry, decoder, stale_if_error)
+    return await asyncio.shield(refresh)
+
+def start_cache_refresh(
+    key: str,
+    endpoint: str,
+    headers: Optional[Mapping[str, str]],
+    params: Dict[str, Any],
+    ttl: float,
+    entry: Optional[CacheEntry],
+    decoder: Optional[TypeAdapter[Any]],
+    stale_if_error: bool
+) -> "asyncio.Task[APIResponse]":
+    """Start refreshing a cache entry in a task shared by every caller waiting on it"""
+    # The task outlives any one caller, so it must not join a caller's batch
+    context = copy_context()
+    context.run(_active_batch.set, None)
+    
+    refresh = asyncio.create_task(
+        refresh_cache_entry(key, endpoint, headers, params, ttl, entry, decoder, stale_if_error),
+        context=context
+    )
+    _cache_refreshes[key] = refresh
+    refresh.add_done_callback(lambda _: _cache_refreshes.pop(key, None))
+    return refresh
+
+async def refresh_cache_entry(
+    key: str,
+    endpoint: str,
+    headers: Optional[Mapping[str, str]],
+    params: Dict[str, Any],
+    ttl: float,
+    entry: Optional[CacheEntry],
+    decoder: Optional[TypeAdapter[Any]],
+    stale_if_error: bool
+) -> APIResponse:
+    """Fetch a GET response into the cache, revalidating against the cached ETag"""
+    etag = entry.etag if entry is not None else None
+    api_response, etag = await send_api_request("GET", endpoint, headers, params, etag=etag, decoder=decoder)
+    
+    if entry is not None and api_response.status_code == 304:
+        await _response_cache.store(key, entry.response, entry.etag, ttl)
+        return entry.response
+    
+    if api_response.success:
+        # Long-running operations change on every poll until they report
+        # done; Drive omits "done" entirely while they're still running
+        finished = (api_response.data or {}).get("done") is True
+        if finished or not endpoint.startswith(OPERATIONS_PREFIX):
+            await _response_cache.store(key, api_response, etag, ttl)
+        return api_response
+    
+    if stale_if_error and entry is not None and (api_response.status_code == 0 or api_response.status_code >= 500):
+        # Keep serving the last known response through brief API outages
+        if time.time() < entry.stale_until + STALE_IF_ERROR_SECONDS:
+            return entry.response
+    
+    return api_response
+
+async def send_api_request(
+    method: str,
+    endpoint: str,
+    headers: Optional[Mapping[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json_data: Optional[Dict[str, Any]] = None,
+    data: Optional[bytes] = None,
+    retry_auth: bool = True,
+    etag: Optional[str] = None,
+    decoder: Optional[TypeAdapter[Any]] = None
+) -> tuple[APIResponse, Optional[str]]:
+    """Send a request with auth, rate limiting and retries, returning the response and its ETag"""
     url = f"{BASE_URL}{endpoint}"
     
+    # Inside a BatchContext, queue the call for the next batch request instead
+    batch = _active_batch.get()
+    if batch is not None and headers is None and data is None and endpoint.startswith("/drive/"):
+        api_response = await batch.enqueue(SubRequest(
+            method=method,
+            endpoint=endpoint,
+            params=params,
+            json_data=json_data
+        ))
+        return apply_decoder(api_response, decoder), None
+    
     # Get access token if not provided in headers
+    access_token = None
     if not headers or "Authorization" not in headers:
         try:
-            access_token = get_access_token()
-            if not headers:
-                headers = {}
-            headers["Authorization"] = f"Bearer {access_token}"
+            access_token = await get_access_token()
         except Exception as e:
             return APIResponse(
                 success=False,
                 status_code=0,
                 data=None,
                 error=f"Failed to get access token: {str(e)}"
+            ), None
+    
+    extra_headers: Dict[str, str] = {}
+    if etag:
+        extra_headers["If-None-Match"] = etag
+    
+    # Serialize JSON bodies once up front with pydantic-core's Rust encoder
+    if json_data is not None:
+        data = to_json(json_data)
+        extra_headers["Content-Type"] = "application/json"
+    
+    def build_headers() -> Mapping[str, str]:
+        # Plain authenticated calls send the shared auth_headers mapping as is;
+        # only calls that add headers of their own pay for a merged copy
+        token_headers = auth_headers(access_token) if access_token else {}
+        if not headers and not extra_headers:
+            return token_headers
+        return {**(headers or {}), **token_headers, **extra_headers}
+    
+    request_headers = build_headers()
+    
+    client = get_http_client()
+    # Drive counts each call inside a batch against the quota, so
+    # execute_batch takes tokens per sub-request instead
+    limiter = None if endpoint == BATCH_PATH else get_rate_limiter(method)
+    
+    async def send() -> httpx.Response:
+        for attempt in range(MAX_RETRIES + 1):
+            if limiter is not None:
+                await limiter.acquire()
+            response = await client.request(
+                method=method,
+                url=url,
+                headers=request_headers,
+                params=params,
+                content=data
             )
+            if attempt == MAX_RETRIES or not should_retry(response):
+                return response
+            await asyncio.sleep(get_retry_delay(response, attempt))
+        return response
     
     try:
-        response = requests.request(
-            method=method,
-            url=url,
-            headers=headers,
-            params=params,
-            json=json_data,
-            data=data,
-            timeout=30
-        )
+        response = await send()
         
         # If we get a 401 and retry_auth is True, try to refresh the token
         if response.status_code == 401 and retry_auth:
             try:
-                access_token = refresh_access_token()
-                headers["Authorization"] = f"Bearer {access_token}"
+                access_token = await refresh_access_token(access_token)
+                request_headers = build_headers()
                 # Retry the request with the new token
-                response = requests.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    json=json_data,
-                    data=data,
-                    timeout=30
-                )
+                response = await send()
             except Exception as e:
                 return APIResponse(
                     success=False,
                     status_code=401,
                     data=None,
                     error=f"Failed to refresh access token: {str(e)}"
-                )
+                ), None
         
-        response_data = None
-        if response.content:
-            try:
-                response_data = response.json()
-            except:
-                response_data = {"content": response.text}
+        # Error bodies don't match the decoder's shape, so decode them generically
+        response_data = decode_response_body(response, decoder if response.is_success else None)
         
-        return APIResponse(
-            success=response.ok,
+        api_response = APIResponse(
+            success=response.is_success,
             status_code=response.status_code,
             data=response_data,
-            error=None if response.ok else f"HTTP {response.status_code}: {response.reason}"
+            error=None if response.is_success else f"HTTP {response.status_code}: {response.reason_phrase}"
         )
-    except requests.exceptions.RequestException as e:
+        
+        return api_response, response.headers.get("ETag")
+    except httpx.HTTPError as e:
         return APIResponse(
             success=False,
             status_code=0,
             data=None,
             error=str(e)
+        ), None
+
+async def send_batch_request(sub_requests: List[SubRequest]) -> List[APIResponse]:
+    """Send one multipart batch request, taking a rate-limit token per sub-request"""
+    for sub_request in sub_requests:
+        await get_rate_limiter(sub_request.method).acquire()
+    
+    boundary = f"batch_{uuid.uuid4().hex}"
+    headers = {"Content-Type": f"multipart/mixed; boundary={boundary}"}
+    response = await make_api_request(
+        "POST",
+        BATCH_PATH,
+        headers=headers,
+        data=encode_batch_body(sub_requests, boundary)
+    )
+    
+    parts = (response.data or {}).get("responses") if response.success else None
+    if parts is None or len(parts) != len(sub_requests):
+        error = response.error or "Malformed batch response"
+        return [
+            APIResponse(success=False, status_code=response.status_code, data=None, error=error)
+            for _ in sub_requests
+        ]
+    return [APIResponse(**fields) for fields in parts]
+
+async def execute_batch(sub_requests: List[SubRequest]) -> List[APIResponse]:
+    """Send sub-requests through the Drive batch endpoint, returning their responses in order.
+
+    Sub-requests rejected for rate limits are resent in a smaller batch with
+    exponential backoff, up to MAX_RETRIES times.
+    """
+    
+    async def send_chunk(chunk: List[SubRequest]) -> List[APIResponse]:
+        responses = await send_batch_request(chunk)
+        for attempt in range(MAX_RETRIES):
+            limited = [index for index, response in enumerate(responses) if is_rate_limited(response)]
+            if not limited:
+                break
+            
+            await asyncio.sleep(get_backoff_delay(attempt))
+            retried = await send_batch_request([chunk[index] for index in limited])
+            for index, response in zip(limited, retried):
+                responses[index] = response
+        return responses
+    
+    chunks = [
+        sub_requests[start:start + BATCH_MAX_SIZE]
+        for start in range(0, len(sub_requests), BATCH_MAX_SIZE)
+    ]
+    results = await asyncio.gather(*(send_chunk(chunk) for chunk in chunks))
+    return [response for chunk_responses in results for response in chunk_responses]
+
+# Set in tasks started by BatchContext.run, whose API calls get batched
+_active_batch: ContextVar[Optional["BatchContext"]] = ContextVar("_active_batch", default=None)
+
+class BatchContext:
+    """Runs coroutines concurrently and sends their Drive API calls as batch requests.
+
+    Calls started with run() inside `async with BatchContext() as batch:` queue
+    their make_api_request calls instead of sending them. Whenever every
+    running call is waiting on the queue, the queued calls go out together
+    through execute_batch. Leaving the block waits for all calls to finish.
+    """
+    
+    def __init__(self) -> None:
+        self.tasks: List["asyncio.Task[Any]"] = []
+        self.pending: List[tuple[SubRequest, asyncio.Future]] = []
+        self.wakeup = asyncio.Event()
+    
+    def run(self, coroutine: Coroutine[Any, Any, Any]) -> "asyncio.Task[Any]":
+        """Start a coroutine whose API calls are batched"""
+        token = _active_batch.set(self)
+        try:
+            task = asyncio.create_task(coroutine)
+        finally:
+            _active_batch.reset(token)
+        task.add_done_callback(lambda _: self.wakeup.set())
+        self.tasks.append(task)
+        return task
+    
+    async def enqueue(self, sub_request: SubRequest) -> APIResponse:
+        """Queue a call for the next batch request and wait for its response"""
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((sub_request, future))
+        self.wakeup.set()
+        return await future
+    
+    async def __aenter__(self) -> "BatchContext":
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        if exc_type is not None:
+            for task in self.tasks:
+                task.cancel()
+            return
+        
+        queued: List[tuple[SubRequest, asyncio.Future]] = []
+        try:
+            while True:
+                running = sum(1 for task in self.tasks if not task.done())
+                if not running and not self.pending:
+                    return
+                
+                if self.pending and len(self.pending) >= running:
+                    queued, self.pending = self.pending, []
+                    responses = await execute_batch([sub_request for sub_request, _ in queued])
+                    for (_, future), response in zip(queued, responses):
+                        if not future.done():
+                            future.set_result(response)
+                    queued = []
+                    continue
+                
+                self.wakeup.clear()
+                await self.wakeup.wait()
+        except BaseException:
+            # A failed or cancelled flush would otherwise leave the calls
+            # waiting on these futures pending forever
+            for _, future in queued + self.pending:
+                future.cancel()
+            self.pending = []
+            for task in self.tasks:
+                task.cancel()
+            raise
+
+# Downloads are streamed to disk in chunks of this many bytes
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+async def download_to_file(
+    endpoint: str,
+    destination_path: str,
+    params: Optional[Dict[str, Any]] = None
+) -> APIResponse:
+    """Stream a Drive API response body to a file without holding it in memory"""
+    url = f"{BASE_URL}{endpoint}"
+    params = encode_query_params(params)
+    
+    try:
+        access_token = await get_access_token()
+    except Exception as e:
+        return APIResponse(
+            success=False,
+            status_code=0,
+            data=None,
+            error=f"Failed to get access token: {str(e)}"
         )
+    
+    client = get_http_client()
+    # Write beside the destination and move it into place only once complete,
+    # so a failed download never leaves a truncated file behind
+    temp_path = f"{destination_path}.{uuid.uuid4().hex}.part"
+    try:
+        refreshed = False
+        attempt = 0
+        while True:
+            await get_rate_limiter("GET").acquire()
+            async with client.stream("GET", url, headers=auth_headers(access_token), params=params) as response:
+                # Refresh the token once on a 401, like make_api_request
+                if response.status_code == 401 and not refreshed:
+                    try:
+                        access_token = await refresh_access_token(access_token)
+                    except Exception as e:
+                        return APIResponse(
+                            success=False,
+                            status_code=401,
+                            data=None,
+                            error=f"Failed to refresh access token: {str(e)}"
+                        )
+                    refreshed = True
+                    continue
+                
+                if not response.is_success:
+                    # Error bodies are small; read them to spot rate-limit errors
+                    await response.aread()
+                    if attempt == MAX_RETRIES or not should_retry(response):
+                        return APIResponse(
+                            success=False,
+                            status_code=response.status_code,
+                            data=None,
+                            error=f"HTTP {response.status_code}: {response.reason_phrase}"
+                        )
+                    delay = get_retry_delay(response, attempt)
+                else:
+                    size = 0
+                    with open(temp_path, "wb") as sink:
+                        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            sink.write(chunk)
+                            size += len(chunk)
+                    os.replace(temp_path, destination_path)
+                    
+                    return APIResponse(
+                        success=True,
+                        status_code=response.status_code,
+                        data={
+                            "path": destination_path,
+                            "size": size,
+                            "mimeType": response.headers.get("Content-Type")
+                        },
+                        error=None
+                    )
+            
+            attempt += 1
+            await asyncio.sleep(delay)
+    except (httpx.HTTPError, OSError) as e:
+        return APIResponse(
+            success=False,
+            status_code=0,
+            data=None,
+            error=str(e)
+        )
+    finally:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+
+def drop_unset(**values: Any) -> Dict[str, Any]:
+    """Build a params or body dict from API-named keyword arguments, dropping unset ones.
+
+    Booleans are kept when False; any other value is dropped when empty
+    (None, "", 0 or an empty list).
+    """
+    return {key: value for key, value in values.items() if value is False or (value is not None and value)}
+
+# Upper bound on pages walked by a single *_list_all tool call
+MAX_LIST_ALL_PAGES = 50
+
+def with_page_tokens(fields: str, *tokens: str) -> str:
+    """Add the page token fields a pagination walk relies on to a partial-response mask.
+
+    Without nextPageToken in the mask Drive drops it from the response, and a
+    walk would stop after the first page looking complete.
+    """
+    if fields.strip() == "*":
+        return fields
+    
+    top_level = {field.strip() for field in fields.split(",")}
+    missing = [token for token in tokens or ("nextPageToken",) if token not in top_level]
+    return ",".join([*missing, fields])
+
+# Concurrent requests in flight for a single *_bulk_get tool call, kept under
+# Drive's per-user queries-per-second quota
+BULK_GET_CONCURRENCY = 8
+
+async def fetch_all_pages(
+    endpoint: str,
+    params: Dict[str, Any],
+    items_key: str,
+    max_pages: int = MAX_LIST_ALL_PAGES
+) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Follow nextPageToken across a list endpoint, returning merged items and the last page.
+
+    Each page token is only known once the previous page arrives, so pages are
+    fetched back to back. The last page keeps its nextPageToken when the walk
+    stops early (page cap or failed request) so callers can resume from it.
+    """
+    items = []
+    last_page = {}
+    for _ in range(max_pages):
+        response = await make_api_request("GET", endpoint, params=params)
+        if not response.success or not response.data:
+            break
+        
+        last_page = response.data
+        items.extend(last_page.get(items_key, []))
+        next_page_token = last_page.get("nextPageToken")
+        if not next_page_token:
+            break
+        params = {**params, "pageToken": next_page_token}
+    
+    return items, last_page
 
 # About resource tools
 @mcp.tool()
-def about_get(
+async def about_get(
     fields: Optional[str] = None
 ) -> APIResponse:
     """Gets information about the user, the user's Drive, and system capabilities."""
-    params = {}
-    if fields:
-        params["fields"] = fields
+    params = drop_unset(fields=fields)
     
-    return make_api_request("GET", "/drive/v3/about", params=params)
+    return await make_api_request("GET", "/drive/v3/about", params=params, cache_ttl=CACHE_TTL_LONG)
 
 # Access proposals resource tools
 @mcp.tool()
-def accessproposals_get(
+async def accessproposals_get(
     file_id: str,
     proposal_id: str
 ) -> APIResponse:
     """Retrieves an AccessProposal by ID."""
-    endpoint = f"/drive/v3/files/{file_id}/accessproposals/{proposal_id}"
-    return make_api_request("GET", endpoint)
+    endpoint = drive_path(ACCESS_PROPOSAL_PATH, file_id, proposal_id)
+    return await make_api_request("GET", endpoint)
 
 @mcp.tool()
-def accessproposals_list(
+async def accessproposals_list(
     file_id: str,
     page_token: Optional[str] = None,
     page_size: Optional[int] = None
 ) -> AccessProposalList:
     """List the AccessProposals on a file."""
-    params = {}
-    if page_token:
-        params["pageToken"] = page_token
-    if page_size:
-        params["pageSize"] = page_size
+    params = drop_unset(
+        pageToken=page_token,
+        pageSize=page_size
+    )
     
-    endpoint = f"/drive/v3/files/{file_id}/accessproposals"
-    response = make_api_request("GET", endpoint, params=params)
+    endpoint = drive_path(ACCESS_PROPOSALS_PATH, file_id)
+    response = await make_api_request("GET", endpoint, params=params)
     
     if response.success and response.data:
         return AccessProposalList(
-            accessProposals=[AccessProposal(**item) for item in response.data.get("accessProposals", [])],
+            accessProposals=_ACCESS_PROPOSALS_ADAPTER.validate_python(response.data.get("accessProposals", [])),
             nextPageToken=response.data.get("nextPageToken")
         )
     else:
         return AccessProposalList()
 
 @mcp.tool()
-def accessproposals_resolve(
+async def accessproposals_resolve(
     file_id: str,
     proposal_id: str,
     action: str,
     send_notification: Optional[bool] = None
 ) -> APIResponse:
     """Used to approve or deny an Access Proposal."""
-    json_data = {"action": action}
-    if send_notification is not None:
-        json_data["sendNotification"] = send_notification
+    json_data = drop_unset(
+        action=action,
+        sendNotification=send_notification
+    )
     
-    endpoint = f"/drive/v3/files/{file_id}/accessproposals/{proposal_id}:resolve"
-    return make_api_request("POST", endpoint, json_data=json_data)
+    endpoint = drive_path(ACCESS_PROPOSAL_RESOLVE_PATH, file_id, proposal_id)
+    return await make_api_request("POST", endpoint, json_data=json_data)
 
 # Apps resource tools
 @mcp.tool()
-def apps_get(
+async def apps_get(
     app_id: str
 ) -> APIResponse:
     """Gets a specific app."""
-    endpoint = f"/drive/v3/apps/{app_id}"
-    return make_api_request("GET", endpoint)
+    endpoint = drive_path(APP_PATH, app_id)
+    return await make_api_request("GET", endpoint, cache_ttl=CACHE_TTL_LONG)
 
 @mcp.tool()
-def apps_list(
+async def apps_list(
     app_filter_extensions: Optional[str] = None,
     app_filter_mime_types: Optional[str] = None,
-    language_code: Optional[str] = None
+    language_code: Optional[str] = None,
+    fields: Optional[str] = None
 ) -> AppList:
-    """Lists a user's installed apps."""
-    params = {}
-    if app_filter_extensions:
-        params["appFilterExtensions"] = app_filter_extensions
-    if app_filter_mime_types:
-        params["appFilterMimeTypes"] = app_filter_mime_types
-    if language_code:
-        params["languageCode"] = language_code
+    """Lists a user's installed apps. Pass fields to override the default partial-response mask."""
+    params = drop_unset(
+        fields=fields or DEFAULT_APP_LIST_FIELDS,
+        appFilterExtensions=app_filter_extensions,
+        appFilterMimeTypes=app_filter_mime_types,
+        languageCode=language_code
+    )
     
-    response = make_api_request("GET", "/drive/v3/apps", params=params)
+    response = await make_api_request("GET", "/drive/v3/apps", params=params)
     
     if response.success and response.data:
         return AppList(
-            apps=[App(**item) for item in response.data.get("apps", [])]
+            apps=_APPS_ADAPTER.validate_python(response.data.get("apps", []))
         )
     else:
         return AppList()
 
+async def invalidate_changed_files(changes: List[Dict[str, Any]]) -> None:
+    """Drop cached responses for the files a changes listing reports as changed"""
+    file_ids = {change["fileId"] for change in changes if change.get("fileId")}
+    if file_ids:
+        await _response_cache.invalidate({quote_path_segment(file_id) for file_id in file_ids})
+
+def filter_changes(changes: List[Dict[str, Any]], file_ids: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """Keep only the changes to the given files, or all changes when file_ids is empty"""
+    if not file_ids:
+        return changes
+    wanted = set(file_ids)
+    return [change for change in changes if change.get("fileId") in wanted]
+
 # Changes resource tools
 @mcp.tool()
-def changes_get_start_page_token(
+async def changes_get_start_page_token(
     drive_id: Optional[str] = None,
     supports_all_drives: Optional[bool] = None
 ) -> APIResponse:
     """Gets the starting pageToken for listing future changes."""
-    params = {}
-    if drive_id:
-        params["driveId"] = drive_id
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
+    params = drop_unset(
+        driveId=drive_id,
+        supportsAllDrives=supports_all_drives
+    )
     
-    return make_api_request("GET", "/drive/v3/changes/startPageToken", params=params)
+    return await make_api_request("GET", "/drive/v3/changes/startPageToken", params=params)
 
 @mcp.tool()
-def changes_list(
+async def changes_list(
     page_token: str,
     drive_id: Optional[str] = None,
     include_corpus_removals: Optional[bool] = None,
@@ -398,33 +1465,30 @@ def changes_list(
     page_size: Optional[int] = None,
     restrict_to_my_drive: Optional[bool] = None,
     spaces: Optional[str] = None,
-    supports_all_drives: Optional[bool] = None
+    supports_all_drives: Optional[bool] = None,
+    fields: Optional[str] = None,
+    file_ids: Optional[List[str]] = None
 ) -> ChangeList:
-    """Lists the changes for a user or shared drive."""
-    params = {"pageToken": page_token}
-    
-    if drive_id:
-        params["driveId"] = drive_id
-    if include_corpus_removals is not None:
-        params["includeCorpusRemovals"] = include_corpus_removals
-    if include_items_from_all_drives is not None:
-        params["includeItemsFromAllDrives"] = include_items_from_all_drives
-    if include_removed is not None:
-        params["includeRemoved"] = include_removed
-    if page_size:
-        params["pageSize"] = page_size
-    if restrict_to_my_drive is not None:
-        params["restrictToMyDrive"] = restrict_to_my_drive
-    if spaces:
-        params["spaces"] = spaces
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    
-    response = make_api_request("GET", "/drive/v3/changes", params=params)
+    """Lists the changes for a user or shared drive since page_token; poll it with the returned newStartPageToken to sync only what changed instead of re-listing files, permissions or revisions. Pass fields to override the default partial-response mask, and file_ids to keep only changes to those files."""
+    params = drop_unset(
+        fields=fields or DEFAULT_CHANGE_LIST_FIELDS,
+        pageToken=page_token,
+        driveId=drive_id,
+        includeCorpusRemovals=include_corpus_removals,
+        includeItemsFromAllDrives=include_items_from_all_drives,
+        includeRemoved=include_removed,
+        pageSize=page_size,
+        restrictToMyDrive=restrict_to_my_drive,
+        spaces=spaces,
+        supportsAllDrives=supports_all_drives
+    )
+    
+    response = await make_api_request("GET", "/drive/v3/changes", params=params)
     
     if response.success and response.data:
+        await invalidate_changed_files(response.data.get("changes", []))
         return ChangeList(
-            changes=[Change(**item) for item in response.data.get("changes", [])],
+            changes=_CHANGES_ADAPTER.validate_python(filter_changes(response.data.get("changes", []), file_ids)),
             nextPageToken=response.data.get("nextPageToken"),
             newStartPageToken=response.data.get("newStartPageToken")
         )
@@ -432,7 +1496,44 @@ def changes_list(
         return ChangeList()
 
 @mcp.tool()
-def changes_watch(
+async def changes_list_all(
+    page_token: str,
+    drive_id: Optional[str] = None,
+    include_corpus_removals: Optional[bool] = None,
+    include_items_from_all_drives: Optional[bool] = None,
+    include_removed: Optional[bool] = None,
+    restrict_to_my_drive: Optional[bool] = None,
+    spaces: Optional[str] = None,
+    supports_all_drives: Optional[bool] = None,
+    fields: Optional[str] = None,
+    file_ids: Optional[List[str]] = None,
+    max_pages: int = MAX_LIST_ALL_PAGES
+) -> ChangeList:
+    """Lists all changes since page_token in one call, following pagination server-side. Pass fields to override the default partial-response mask, and file_ids to keep only changes to those files."""
+    params = drop_unset(
+        fields=with_page_tokens(fields or DEFAULT_CHANGE_LIST_FIELDS, "nextPageToken", "newStartPageToken"),
+        pageToken=page_token,
+        pageSize=1000,
+        driveId=drive_id,
+        includeCorpusRemovals=include_corpus_removals,
+        includeItemsFromAllDrives=include_items_from_all_drives,
+        includeRemoved=include_removed,
+        restrictToMyDrive=restrict_to_my_drive,
+        spaces=spaces,
+        supportsAllDrives=supports_all_drives
+    )
+    
+    items, last_page = await fetch_all_pages("/drive/v3/changes", params, "changes", max_pages)
+    await invalidate_changed_files(items)
+    
+    return ChangeList(
+        changes=_CHANGES_ADAPTER.validate_python(filter_changes(items, file_ids)),
+        nextPageToken=last_page.get("nextPageToken"),
+        newStartPageToken=last_page.get("newStartPageToken")
+    )
+
+@mcp.tool()
+async def changes_watch(
     page_token: str,
     channel_id: str,
     channel_type: str,
@@ -447,24 +1548,17 @@ def changes_watch(
     supports_all_drives: Optional[bool] = None
 ) -> APIResponse:
     """Subscribes to changes for a user."""
-    params = {"pageToken": page_token}
-    
-    if drive_id:
-        params["driveId"] = drive_id
-    if include_corpus_removals is not None:
-        params["includeCorpusRemovals"] = include_corpus_removals
-    if include_items_from_all_drives is not None:
-        params["includeItemsFromAllDrives"] = include_items_from_all_drives
-    if include_removed is not None:
-        params["includeRemoved"] = include_removed
-    if page_size:
-        params["pageSize"] = page_size
-    if restrict_to_my_drive is not None:
-        params["restrictToMyDrive"] = restrict_to_my_drive
-    if spaces:
-        params["spaces"] = spaces
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
+    params = drop_unset(
+        pageToken=page_token,
+        driveId=drive_id,
+        includeCorpusRemovals=include_corpus_removals,
+        includeItemsFromAllDrives=include_items_from_all_drives,
+        includeRemoved=include_removed,
+        pageSize=page_size,
+        restrictToMyDrive=restrict_to_my_drive,
+        spaces=spaces,
+        supportsAllDrives=supports_all_drives
+    )
     
     json_data = {
         "id": channel_id,
@@ -472,11 +1566,38 @@ def changes_watch(
         "address": address
     }
     
-    return make_api_request("POST", "/drive/v3/changes/watch", params=params, json_data=json_data)
+    return await make_api_request("POST", "/drive/v3/changes/watch", params=params, json_data=json_data)
+
+@mcp.tool()
+async def drive_watch_all(
+    channel_id: str,
+    channel_type: str,
+    address: str,
+    drive_id: Optional[str] = None
+) -> APIResponse:
+    """Subscribes one notification channel to every change in My Drive or a shared drive, starting now. Use this instead of calling files_watch per file; on notification, call changes_list with the returned startPageToken and file_ids to pick out the files of interest."""
+    start = await changes_get_start_page_token(drive_id=drive_id, supports_all_drives=True if drive_id else None)
+    if not start.success or not start.data:
+        return start
+    
+    page_token = start.data.get("startPageToken")
+    response = await changes_watch(
+        page_token=page_token,
+        channel_id=channel_id,
+        channel_type=channel_type,
+        address=address,
+        drive_id=drive_id,
+        include_items_from_all_drives=True if drive_id else None,
+        supports_all_drives=True if drive_id else None
+    )
+    
+    if response.success:
+        response.data = {**(response.data or {}), "startPageToken": page_token}
+    return response
 
 # Channels resource tools
 @mcp.tool()
-def channels_stop(
+async def channels_stop(
     channel_id: str,
     resource_id: str
 ) -> APIResponse:
@@ -486,81 +1607,102 @@ def channels_stop(
         "resourceId": resource_id
     }
     
-    return make_api_request("POST", "/drive/v3/channels/stop", json_data=json_data)
+    return await make_api_request("POST", "/drive/v3/channels/stop", json_data=json_data)
 
 # Comments resource tools
 @mcp.tool()
-def comments_create(
+async def comments_create(
     file_id: str,
     content: str,
     anchor: Optional[str] = None,
     quoted_file_content: Optional[Dict[str, Any]] = None
 ) -> APIResponse:
     """Creates a comment on a file."""
-    json_data = {"content": content}
-    if anchor:
-        json_data["anchor"] = anchor
-    if quoted_file_content:
-        json_data["quotedFileContent"] = quoted_file_content
+    json_data = drop_unset(
+        content=content,
+        anchor=anchor,
+        quotedFileContent=quoted_file_content
+    )
     
-    endpoint = f"/drive/v3/files/{file_id}/comments"
-    return make_api_request("POST", endpoint, json_data=json_data)
+    endpoint = drive_path(COMMENTS_PATH, file_id)
+    return await make_api_request("POST", endpoint, json_data=json_data)
 
 @mcp.tool()
-def comments_delete(
+async def comments_delete(
     file_id: str,
     comment_id: str
 ) -> APIResponse:
     """Deletes a comment."""
-    endpoint = f"/drive/v3/files/{file_id}/comments/{comment_id}"
-    return make_api_request("DELETE", endpoint)
+    endpoint = drive_path(COMMENT_PATH, file_id, comment_id)
+    return await make_api_request("DELETE", endpoint)
 
 @mcp.tool()
-def comments_get(
+async def comments_get(
     file_id: str,
     comment_id: str,
     include_deleted: Optional[bool] = None
 ) -> APIResponse:
     """Gets a comment by ID."""
-    params = {}
-    if include_deleted is not None:
-        params["includeDeleted"] = include_deleted
+    params = drop_unset(includeDeleted=include_deleted)
     
-    endpoint = f"/drive/v3/files/{file_id}/comments/{comment_id}"
-    return make_api_request("GET", endpoint, params=params)
+    endpoint = drive_path(COMMENT_PATH, file_id, comment_id)
+    return await make_api_request("GET", endpoint, params=params, cache_ttl=CACHE_TTL_LONG)
 
 @mcp.tool()
-def comments_list(
+async def comments_list(
     file_id: str,
     include_deleted: Optional[bool] = None,
     page_size: Optional[int] = None,
     page_token: Optional[str] = None,
-    start_modified_time: Optional[str] = None
+    start_modified_time: Optional[str] = None,
+    fields: Optional[str] = None
 ) -> CommentList:
-    """Lists a file's comments."""
-    params = {}
-    if include_deleted is not None:
-        params["includeDeleted"] = include_deleted
-    if page_size:
-        params["pageSize"] = page_size
-    if page_token:
-        params["pageToken"] = page_token
-    if start_modified_time:
-        params["startModifiedTime"] = start_modified_time
-    
-    endpoint = f"/drive/v3/files/{file_id}/comments"
-    response = make_api_request("GET", endpoint, params=params)
+    """Lists a file's comments. Pass fields to override the default partial-response mask."""
+    params = drop_unset(
+        fields=fields or DEFAULT_COMMENT_LIST_FIELDS,
+        includeDeleted=include_deleted,
+        pageSize=page_size,
+        pageToken=page_token,
+        startModifiedTime=start_modified_time
+    )
+    
+    endpoint = drive_path(COMMENTS_PATH, file_id)
+    response = await make_api_request("GET", endpoint, params=params)
     
     if response.success and response.data:
         return CommentList(
-            comments=[Comment(**item) for item in response.data.get("comments", [])],
+            comments=_COMMENTS_ADAPTER.validate_python(response.data.get("comments", [])),
             nextPageToken=response.data.get("nextPageToken")
         )
     else:
         return CommentList()
 
 @mcp.tool()
-def comments_update(
+async def comments_list_all(
+    file_id: str,
+    include_deleted: Optional[bool] = None,
+    start_modified_time: Optional[str] = None,
+    fields: Optional[str] = None,
+    max_pages: int = MAX_LIST_ALL_PAGES
+) -> CommentList:
+    """Lists all of a file's comments in one call, following pagination server-side. Pass fields to override the default partial-response mask."""
+    params = drop_unset(
+        fields=with_page_tokens(fields or DEFAULT_COMMENT_LIST_FIELDS),
+        pageSize=100,
+        includeDeleted=include_deleted,
+        startModifiedTime=start_modified_time
+    )
+    
+    endpoint = drive_path(COMMENTS_PATH, file_id)
+    items, last_page = await fetch_all_pages(endpoint, params, "comments", max_pages)
+    
+    return CommentList(
+        comments=_COMMENTS_ADAPTER.validate_python(items),
+        nextPageToken=last_page.get("nextPageToken")
+    )
+
+@mcp.tool()
+async def comments_update(
     file_id: str,
     comment_id: str,
     content: str
@@ -568,118 +1710,111 @@ def comments_update(
     """Updates a comment with patch semantics."""
     json_data = {"content": content}
     
-    endpoint = f"/drive/v3/files/{file_id}/comments/{comment_id}"
-    return make_api_request("PATCH", endpoint, json_data=json_data)
+    endpoint = drive_path(COMMENT_PATH, file_id, comment_id)
+    return await make_api_request("PATCH", endpoint, json_data=json_data)
 
 # Drives resource tools
 @mcp.tool()
-def drives_create(
+async def drives_create(
     request_id: str,
     name: str,
     hidden: Optional[bool] = None
 ) -> APIResponse:
     """Creates a shared drive."""
     params = {"requestId": request_id}
-    json_data = {"name": name}
-    if hidden is not None:
-        json_data["hidden"] = hidden
+    json_data = drop_unset(
+        name=name,
+        hidden=hidden
+    )
     
-    return make_api_request("POST", "/drive/v3/drives", params=params, json_data=json_data)
+    return await make_api_request("POST", "/drive/v3/drives", params=params, json_data=json_data)
 
 @mcp.tool()
-def drives_delete(
+async def drives_delete(
     drive_id: str,
     use_domain_admin_access: Optional[bool] = None,
     allow_item_deletion: Optional[bool] = None
 ) -> APIResponse:
     """Permanently deletes a shared drive for which the user is an organizer."""
-    params = {}
-    if use_domain_admin_access is not None:
-        params["useDomainAdminAccess"] = use_domain_admin_access
-    if allow_item_deletion is not None:
-        params["allowItemDeletion"] = allow_item_deletion
+    params = drop_unset(
+        useDomainAdminAccess=use_domain_admin_access,
+        allowItemDeletion=allow_item_deletion
+    )
     
-    endpoint = f"/drive/v3/drives/{drive_id}"
-    return make_api_request("DELETE", endpoint, params=params)
+    endpoint = drive_path(DRIVE_PATH, drive_id)
+    return await make_api_request("DELETE", endpoint, params=params)
 
 @mcp.tool()
-def drives_get(
+async def drives_get(
     drive_id: str,
     use_domain_admin_access: Optional[bool] = None
 ) -> APIResponse:
     """Gets a shared drive's metadata by ID."""
-    params = {}
-    if use_domain_admin_access is not None:
-        params["useDomainAdminAccess"] = use_domain_admin_access
+    params = drop_unset(useDomainAdminAccess=use_domain_admin_access)
     
-    endpoint = f"/drive/v3/drives/{drive_id}"
-    return make_api_request("GET", endpoint, params=params)
+    endpoint = drive_path(DRIVE_PATH, drive_id)
+    return await make_api_request("GET", endpoint, params=params, cache_ttl=CACHE_TTL_LONG)
 
 @mcp.tool()
-def drives_hide(
+async def drives_hide(
     drive_id: str
 ) -> APIResponse:
     """Hides a shared drive from the default view."""
-    endpoint = f"/drive/v3/drives/{drive_id}/hide"
-    return make_api_request("POST", endpoint)
+    endpoint = drive_path(DRIVE_HIDE_PATH, drive_id)
+    return await make_api_request("POST", endpoint)
 
 @mcp.tool()
-def drives_list(
+async def drives_list(
     page_size: Optional[int] = None,
     page_token: Optional[str] = None,
     q: Optional[str] = None,
-    use_domain_admin_access: Optional[bool] = None
+    use_domain_admin_access: Optional[bool] = None,
+    fields: Optional[str] = None
 ) -> DriveList:
-    """Lists the user's shared drives."""
-    params = {}
-    if page_size:
-        params["pageSize"] = page_size
-    if page_token:
-        params["pageToken"] = page_token
-    if q:
-        params["q"] = q
-    if use_domain_admin_access is not None:
-        params["useDomainAdminAccess"] = use_domain_admin_access
-    
-    response = make_api_request("GET", "/drive/v3/drives", params=params)
+    """Lists the user's shared drives. Pass fields to override the default partial-response mask."""
+    params = drop_unset(
+        fields=fields or DEFAULT_DRIVE_LIST_FIELDS,
+        pageSize=page_size,
+        pageToken=page_token,
+        q=q,
+        useDomainAdminAccess=use_domain_admin_access
+    )
+    
+    response = await make_api_request("GET", "/drive/v3/drives", params=params)
     
     if response.success and response.data:
         return DriveList(
-            drives=[Drive(**item) for item in response.data.get("drives", [])],
+            drives=_DRIVES_ADAPTER.validate_python(response.data.get("drives", [])),
             nextPageToken=response.data.get("nextPageToken")
         )
     else:
         return DriveList()
 
 @mcp.tool()
-def drives_unhide(
+async def drives_unhide(
     drive_id: str
 ) -> APIResponse:
     """Restores a shared drive to the default view."""
-    endpoint = f"/drive/v3/drives/{drive_id}/unhide"
-    return make_api_request("POST", endpoint)
+    endpoint = drive_path(DRIVE_UNHIDE_PATH, drive_id)
+    return await make_api_request("POST", endpoint)
 
 @mcp.tool()
-def drives_update(
+async def drives_update(
     drive_id: str,
     name: Optional[str] = None,
     use_domain_admin_access: Optional[bool] = None
 ) -> APIResponse:
     """Updates the metadata for a shared drive."""
-    params = {}
-    if use_domain_admin_access is not None:
-        params["useDomainAdminAccess"] = use_domain_admin_access
+    params = drop_unset(useDomainAdminAccess=use_domain_admin_access)
     
-    json_data = {}
-    if name:
-        json_data["name"] = name
+    json_data = drop_unset(name=name)
     
-    endpoint = f"/drive/v3/drives/{drive_id}"
-    return make_api_request("PATCH", endpoint, params=params, json_data=json_data)
+    endpoint = drive_path(DRIVE_PATH, drive_id)
+    return await make_api_request("PATCH", endpoint, params=params, json_data=json_data)
 
 # Files resource tools
 @mcp.tool()
-def files_copy(
+async def files_copy(
     file_id: str,
     name: Optional[str] = None,
     parents: Optional[List[str]] = None,
@@ -689,27 +1824,23 @@ def files_copy(
     supports_all_drives: Optional[bool] = None
 ) -> APIResponse:
     """Creates a copy of a file and applies any requested updates with patch semantics."""
-    params = {}
-    if ignore_default_visibility is not None:
-        params["ignoreDefaultVisibility"] = ignore_default_visibility
-    if keep_revision_forever is not None:
-        params["keepRevisionForever"] = keep_revision_forever
-    if ocr_language:
-        params["ocrLanguage"] = ocr_language
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    
-    json_data = {}
-    if name:
-        json_data["name"] = name
-    if parents:
-        json_data["parents"] = parents
-    
-    endpoint = f"/drive/v3/files/{file_id}/copy"
-    return make_api_request("POST", endpoint, params=params, json_data=json_data)
-
-@mcp.tool()
-def files_create(
+    params = drop_unset(
+        ignoreDefaultVisibility=ignore_default_visibility,
+        keepRevisionForever=keep_revision_forever,
+        ocrLanguage=ocr_language,
+        supportsAllDrives=supports_all_drives
+    )
+    
+    json_data = drop_unset(
+        name=name,
+        parents=parents
+    )
+    
+    endpoint = drive_path(FILE_COPY_PATH, file_id)
+    return await make_api_request("POST", endpoint, params=params, json_data=json_data)
+
+@mcp.tool()
+async def files_create(
     name: str,
     parents: Optional[List[str]] = None,
     mime_type: Optional[str] = None,
@@ -720,115 +1851,109 @@ def files_create(
     use_content_as_indexable_text: Optional[bool] = None
 ) -> APIResponse:
     """Creates a new file."""
-    params = {}
-    if ignore_default_visibility is not None:
-        params["ignoreDefaultVisibility"] = ignore_default_visibility
-    if keep_revision_forever is not None:
-        params["keepRevisionForever"] = keep_revision_forever
-    if ocr_language:
-        params["ocrLanguage"] = ocr_language
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    if use_content_as_indexable_text is not None:
-        params["useContentAsIndexableText"] = use_content_as_indexable_text
-    
-    json_data = {"name": name}
-    if parents:
-        json_data["parents"] = parents
-    if mime_type:
-        json_data["mimeType"] = mime_type
-    
-    return make_api_request("POST", "/upload/drive/v3/files", params=params, json_data=json_data)
-
-@mcp.tool()
-def files_delete(
+    params = drop_unset(
+        ignoreDefaultVisibility=ignore_default_visibility,
+        keepRevisionForever=keep_revision_forever,
+        ocrLanguage=ocr_language,
+        supportsAllDrives=supports_all_drives,
+        useContentAsIndexableText=use_content_as_indexable_text
+    )
+    
+    json_data = drop_unset(
+        name=name,
+        parents=parents,
+        mimeType=mime_type
+    )
+    
+    return await make_api_request("POST", "/upload/drive/v3/files", params=params, json_data=json_data)
+
+@mcp.tool()
+async def files_delete(
     file_id: str,
     supports_all_drives: Optional[bool] = None
 ) -> APIResponse:
     """Permanently deletes a file owned by the user without moving it to the trash."""
-    params = {}
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
+    params = drop_unset(supportsAllDrives=supports_all_drives)
     
-    endpoint = f"/drive/v3/files/{file_id}"
-    return make_api_request("DELETE", endpoint, params=params)
+    endpoint = drive_path(FILE_PATH, file_id)
+    return await make_api_request("DELETE", endpoint, params=params)
 
 @mcp.tool()
-def files_download(
+async def files_download(
     file_id: str,
     mime_type: Optional[str] = None,
     revision_id: Optional[str] = None
 ) -> APIResponse:
     """Downloads content of a file."""
-    params = {}
-    if mime_type:
-        params["mimeType"] = mime_type
-    if revision_id:
-        params["revisionId"] = revision_id
+    params = drop_unset(
+        mimeType=mime_type,
+        revisionId=revision_id
+    )
     
-    endpoint = f"/drive/v3/files/{file_id}/download"
-    return make_api_request("POST", endpoint, params=params)
+    endpoint = drive_path(FILE_DOWNLOAD_PATH, file_id)
+    return await make_api_request("POST", endpoint, params=params)
 
 @mcp.tool()
-def files_empty_trash(
+async def files_empty_trash(
     drive_id: Optional[str] = None
 ) -> APIResponse:
     """Permanently deletes all of the user's trashed files."""
-    params = {}
-    if drive_id:
-        params["driveId"] = drive_id
+    params = drop_unset(driveId=drive_id)
     
-    return make_api_request("DELETE", "/drive/v3/files/trash", params=params)
+    return await make_api_request("DELETE", "/drive/v3/files/trash", params=params)
 
 @mcp.tool()
-def files_export(
+async def files_export(
     file_id: str,
-    mime_type: str
+    mime_type: str,
+    destination_path: Optional[str] = None
 ) -> APIResponse:
-    """Exports a Google Workspace document to the requested MIME type and returns exported byte content."""
+    """Exports a Google Workspace document to the requested MIME type. Text formats are returned inline; binary formats (PDF, DOCX, ...) only report their content type and size, so pass destination_path to stream the export to a local file, returning its path, size and MIME type."""
     params = {"mimeType": mime_type}
     
-    endpoint = f"/drive/v3/files/{file_id}/export"
-    return make_api_request("GET", endpoint, params=params)
+    endpoint = drive_path(FILE_EXPORT_PATH, file_id)
+    if destination_path:
+        return await download_to_file(endpoint, destination_path, params=params)
+    return await make_api_request("GET", endpoint, params=params)
 
 @mcp.tool()
-def files_generate_ids(
+async def files_generate_ids(
     count: Optional[int] = None,
     space: Optional[str] = None,
     type: Optional[str] = None
 ) -> APIResponse:
     """Generates a set of file IDs which can be provided in create or copy requests."""
-    params = {}
-    if count:
-        params["count"] = count
-    if space:
-        params["space"] = space
-    if type:
-        params["type"] = type
+    params = drop_unset(
+        count=count,
+        space=space,
+        type=type
+    )
     
-    return make_api_request("GET", "/drive/v3/files/generateIds", params=params)
+    return await make_api_request("GET", "/drive/v3/files/generateIds", params=params)
 
 @mcp.tool()
-def files_get(
+async def files_get(
     file_id: str,
     acknowledge_abuse: Optional[bool] = None,
     supports_all_drives: Optional[bool] = None,
-    fields: Optional[str] = None
+    fields: Optional[str] = None,
+    destination_path: Optional[str] = None
 ) -> APIResponse:
-    """Gets a file's metadata or content by ID."""
-    params = {}
-    if acknowledge_abuse is not None:
-        params["acknowledgeAbuse"] = acknowledge_abuse
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    if fields:
-        params["fields"] = fields
-    
-    endpoint = f"/drive/v3/files/{file_id}"
-    return make_api_request("GET", endpoint, params=params)
+    """Gets a file's metadata or content by ID. Pass destination_path to stream the file's content to a local file, returning its path, size and MIME type."""
+    params = drop_unset(
+        acknowledgeAbuse=acknowledge_abuse,
+        supportsAllDrives=supports_all_drives,
+        fields=fields
+    )
+    
+    endpoint = drive_path(FILE_PATH, file_id)
+    if destination_path:
+        params["alt"] = "media"
+        return await download_to_file(endpoint, destination_path, params=params)
+    return await make_api_request("GET", endpoint, params=params, cache_ttl=CACHE_TTL_LONG)
 
 @mcp.tool()
-def files_list(
+async def files_list(
     corpora: Optional[str] = None,
     drive_id: Optional[str] = None,
     include_items_from_all_drives: Optional[bool] = None,
@@ -837,34 +1962,28 @@ def files_list(
     page_token: Optional[str] = None,
     q: Optional[str] = None,
     spaces: Optional[str] = None,
-    supports_all_drives: Optional[bool] = None
+    supports_all_drives: Optional[bool] = None,
+    fields: Optional[str] = None
 ) -> FileList:
-    """Lists the user's files."""
-    params = {}
-    if corpora:
-        params["corpora"] = corpora
-    if drive_id:
-        params["driveId"] = drive_id
-    if include_items_from_all_drives is not None:
-        params["includeItemsFromAllDrives"] = include_items_from_all_drives
-    if order_by:
-        params["orderBy"] = order_by
-    if page_size:
-        params["pageSize"] = page_size
-    if page_token:
-        params["pageToken"] = page_token
-    if q:
-        params["q"] = q
-    if spaces:
-        params["spaces"] = spaces
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    
-    response = make_api_request("GET", "/drive/v3/files", params=params)
+    """Lists the user's files. Pass fields to override the default partial-response mask."""
+    params = drop_unset(
+        fields=fields or DEFAULT_FILE_LIST_FIELDS,
+        corpora=corpora,
+        driveId=drive_id,
+        includeItemsFromAllDrives=include_items_from_all_drives,
+        orderBy=order_by,
+        pageSize=page_size,
+        pageToken=page_token,
+        q=q,
+        spaces=spaces,
+        supportsAllDrives=supports_all_drives
+    )
+    
+    response = await make_api_request("GET", "/drive/v3/files", params=params)
     
     if response.success and response.data:
         return FileList(
-            files=[FileMetadata(**item) for item in response.data.get("files", [])],
+            files=_FILES_ADAPTER.validate_python(response.data.get("files", [])),
             nextPageToken=response.data.get("nextPageToken"),
             incompleteSearch=response.data.get("incompleteSearch")
         )
@@ -872,34 +1991,66 @@ def files_list(
         return FileList()
 
 @mcp.tool()
-def files_list_labels(
+async def files_list_all(
+    corpora: Optional[str] = None,
+    drive_id: Optional[str] = None,
+    include_items_from_all_drives: Optional[bool] = None,
+    order_by: Optional[str] = None,
+    q: Optional[str] = None,
+    spaces: Optional[str] = None,
+    supports_all_drives: Optional[bool] = None,
+    fields: Optional[str] = None,
+    max_pages: int = MAX_LIST_ALL_PAGES
+) -> FileList:
+    """Lists all of the user's files matching the query in one call, following pagination server-side. Pass fields to override the default partial-response mask."""
+    params = drop_unset(
+        fields=with_page_tokens(fields or DEFAULT_FILE_LIST_FIELDS),
+        pageSize=1000,
+        corpora=corpora,
+        driveId=drive_id,
+        includeItemsFromAllDrives=include_items_from_all_drives,
+        orderBy=order_by,
+        q=q,
+        spaces=spaces,
+        supportsAllDrives=supports_all_drives
+    )
+    
+    items, last_page = await fetch_all_pages("/drive/v3/files", params, "files", max_pages)
+    
+    return FileList(
+        files=_FILES_ADAPTER.validate_python(items),
+        nextPageToken=last_page.get("nextPageToken"),
+        incompleteSearch=last_page.get("incompleteSearch")
+    )
+
+@mcp.tool()
+async def files_list_labels(
     file_id: str,
     max_results: Optional[int] = None,
     page_token: Optional[str] = None
 ) -> APIResponse:
     """Lists the labels on a file."""
-    params = {}
-    if max_results:
-        params["maxResults"] = max_results
-    if page_token:
-        params["pageToken"] = page_token
+    params = drop_unset(
+        maxResults=max_results,
+        pageToken=page_token
+    )
     
-    endpoint = f"/drive/v3/files/{file_id}/listLabels"
-    return make_api_request("GET", endpoint, params=params)
+    endpoint = drive_path(FILE_LIST_LABELS_PATH, file_id)
+    return await make_api_request("GET", endpoint, params=params)
 
 @mcp.tool()
-def files_modify_labels(
+async def files_modify_labels(
     file_id: str,
     label_modifications: List[Dict[str, Any]]
 ) -> APIResponse:
     """Modifies the set of labels applied to a file."""
     json_data = {"labelModifications": label_modifications}
     
-    endpoint = f"/drive/v3/files/{file_id}/modifyLabels"
-    return make_api_request("POST", endpoint, json_data=json_data)
+    endpoint = drive_path(FILE_MODIFY_LABELS_PATH, file_id)
+    return await make_api_request("POST", endpoint, json_data=json_data)
 
 @mcp.tool()
-def files_update(
+async def files_update(
     file_id: str,
     name: Optional[str] = None,
     add_parents: Optional[str] = None,
@@ -910,29 +2061,22 @@ def files_update(
     use_content_as_indexable_text: Optional[bool] = None
 ) -> APIResponse:
     """Updates a file's metadata and/or content."""
-    params = {}
-    if add_parents:
-        params["addParents"] = add_parents
-    if remove_parents:
-        params["removeParents"] = remove_parents
-    if keep_revision_forever is not None:
-        params["keepRevisionForever"] = keep_revision_forever
-    if ocr_language:
-        params["ocrLanguage"] = ocr_language
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    if use_content_as_indexable_text is not None:
-        params["useContentAsIndexableText"] = use_content_as_indexable_text
-    
-    json_data = {}
-    if name:
-        json_data["name"] = name
-    
-    endpoint = f"/upload/drive/v3/files/{file_id}"
-    return make_api_request("PATCH", endpoint, params=params, json_data=json_data)
-
-@mcp.tool()
-def files_watch(
+    params = drop_unset(
+        addParents=add_parents,
+        removeParents=remove_parents,
+        keepRevisionForever=keep_revision_forever,
+        ocrLanguage=ocr_language,
+        supportsAllDrives=supports_all_drives,
+        useContentAsIndexableText=use_content_as_indexable_text
+    )
+    
+    json_data = drop_unset(name=name)
+    
+    endpoint = drive_path(FILE_UPLOAD_PATH, file_id)
+    return await make_api_request("PATCH", endpoint, params=params, json_data=json_data)
+
+@mcp.tool()
+async def files_watch(
     file_id: str,
     channel_id: str,
     channel_type: str,
@@ -940,12 +2084,11 @@ def files_watch(
     supports_all_drives: Optional[bool] = None,
     acknowledge_abuse: Optional[bool] = None
 ) -> APIResponse:
-    """Subscribes to changes to a file."""
-    params = {}
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    if acknowledge_abuse is not None:
-        params["acknowledgeAbuse"] = acknowledge_abuse
+    """Subscribes to changes to a file. To follow many files, use drive_watch_all for one channel instead of one channel per file."""
+    params = drop_unset(
+        supportsAllDrives=supports_all_drives,
+        acknowledgeAbuse=acknowledge_abuse
+    )
     
     json_data = {
         "id": channel_id,
@@ -953,22 +2096,24 @@ def files_watch(
         "address": address
     }
     
-    endpoint = f"/drive/v3/files/{file_id}/watch"
-    return make_api_request("POST", endpoint, params=params, json_data=json_data).tool()
-def files_modify_labels(
+    endpoint = drive_path(FILE_WATCH_PATH, file_id)
+    return await make_api_request("POST", endpoint, params=params, json_data=json_data)
+
+@mcp.tool()
+async def files_modify_labels(
     file_id: str,
     access_token: str,
     label_modifications: List[Dict[str, Any]]
 ) -> APIResponse:
     """Modifies the set of labels applied to a file."""
-    headers = {"Authorization": f"Bearer {access_token}"}
+    headers = auth_headers(access_token)
     json_data = {"labelModifications": label_modifications}
     
-    endpoint = f"/drive/v3/files/{file_id}/modifyLabels"
-    return make_api_request("POST", endpoint, headers=headers, json_data=json_data)
+    endpoint = drive_path(FILE_MODIFY_LABELS_PATH, file_id)
+    return await make_api_request("POST", endpoint, headers=headers, json_data=json_data)
 
 @mcp.tool()
-def files_update(
+async def files_update(
     file_id: str,
     access_token: str,
     name: Optional[str] = None,
@@ -980,30 +2125,23 @@ def files_update(
     use_content_as_indexable_text: Optional[bool] = None
 ) -> APIResponse:
     """Updates a file's metadata and/or content."""
-    headers = {"Authorization": f"Bearer {access_token}"}
-    params = {}
-    if add_parents:
-        params["addParents"] = add_parents
-    if remove_parents:
-        params["removeParents"] = remove_parents
-    if keep_revision_forever is not None:
-        params["keepRevisionForever"] = keep_revision_forever
-    if ocr_language:
-        params["ocrLanguage"] = ocr_language
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    if use_content_as_indexable_text is not None:
-        params["useContentAsIndexableText"] = use_content_as_indexable_text
-    
-    json_data = {}
-    if name:
-        json_data["name"] = name
-    
-    endpoint = f"/upload/drive/v3/files/{file_id}"
-    return make_api_request("PATCH", endpoint, headers=headers, params=params, json_data=json_data)
-
-@mcp.tool()
-def files_watch(
+    headers = auth_headers(access_token)
+    params = drop_unset(
+        addParents=add_parents,
+        removeParents=remove_parents,
+        keepRevisionForever=keep_revision_forever,
+        ocrLanguage=ocr_language,
+        supportsAllDrives=supports_all_drives,
+        useContentAsIndexableText=use_content_as_indexable_text
+    )
+    
+    json_data = drop_unset(name=name)
+    
+    endpoint = drive_path(FILE_UPLOAD_PATH, file_id)
+    return await make_api_request("PATCH", endpoint, headers=headers, params=params, json_data=json_data)
+
+@mcp.tool()
+async def files_watch(
     file_id: str,
     access_token: str,
     channel_id: str,
@@ -1012,13 +2150,12 @@ def files_watch(
     supports_all_drives: Optional[bool] = None,
     acknowledge_abuse: Optional[bool] = None
 ) -> APIResponse:
-    """Subscribes to changes to a file."""
-    headers = {"Authorization": f"Bearer {access_token}"}
-    params = {}
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    if acknowledge_abuse is not None:
-        params["acknowledgeAbuse"] = acknowledge_abuse
+    """Subscribes to changes to a file. To follow many files, use drive_watch_all for one channel instead of one channel per file."""
+    headers = auth_headers(access_token)
+    params = drop_unset(
+        supportsAllDrives=supports_all_drives,
+        acknowledgeAbuse=acknowledge_abuse
+    )
     
     json_data = {
         "id": channel_id,
@@ -1026,27 +2163,59 @@ def files_watch(
         "address": address
     }
     
-    endpoint = f"/drive/v3/files/{file_id}/watch"
-    return make_api_request("POST", endpoint, headers=headers, params=params, json_data=json_data)
+    endpoint = drive_path(FILE_WATCH_PATH, file_id)
+    return await make_api_request("POST", endpoint, headers=headers, params=params, json_data=json_data)
 
 # Operations resource tools
 @mcp.tool()
-def operations_get(
+async def operations_get(
     name: str
 ) -> Operation:
     """Gets the latest state of a long-running operation."""
-    endpoint = f"/drive/v3/operations/{name}"
+    endpoint = drive_path(OPERATION_PATH, name)
     
-    response = make_api_request("GET", endpoint)
+    response = await make_api_request("GET", endpoint, cache_ttl=CACHE_TTL_LONG)
     
     if response.success and response.data:
-        return Operation(**response.data)
+        return Operation.model_validate(response.data)
     else:
         return Operation()
 
+async def await_operation(
+    name: str,
+    initial: float = 0.5,
+    factor: float = 2,
+    max_wait: float = 30,
+    deadline: float = 600
+) -> Operation:
+    """Poll a long-running operation until it is done, backing off exponentially with jitter.
+
+    Returns the last state seen if the deadline passes first, or an empty
+    Operation if the operation can't be fetched.
+    """
+    give_up_at = time.monotonic() + deadline
+    attempt = 0
+    while True:
+        operation = await operations_get(name)
+        remaining = give_up_at - time.monotonic()
+        if operation.done or operation.name is None or remaining <= 0:
+            return operation
+        
+        delay = min(initial * factor ** attempt + random.random() * 0.1, max_wait, remaining)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+@mcp.tool()
+async def operations_wait(
+    name: str,
+    timeout: float = 60
+) -> Operation:
+    """Waits for a long-running operation to finish, polling with exponential backoff (0.1s doubling up to 2s), and returns its final state or the last state seen when timeout seconds pass. Use this instead of calling operations_get in a loop."""
+    return await await_operation(name, initial=0.1, factor=2, max_wait=2, deadline=timeout)
+
 # Permissions resource tools
 @mcp.tool()
-def permissions_create(
+async def permissions_create(
     file_id: str,
     role: str,
     type: str,
@@ -1060,98 +2229,145 @@ def permissions_create(
     use_domain_admin_access: Optional[bool] = None
 ) -> APIResponse:
     """Creates a permission for a file or shared drive."""
-    params = {}
-    if email_message:
-        params["emailMessage"] = email_message
-    if move_to_new_owners_root is not None:
-        params["moveToNewOwnersRoot"] = move_to_new_owners_root
-    if send_notification_email is not None:
-        params["sendNotificationEmail"] = send_notification_email
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    if transfer_ownership is not None:
-        params["transferOwnership"] = transfer_ownership
-    if use_domain_admin_access is not None:
-        params["useDomainAdminAccess"] = use_domain_admin_access
-    
-    json_data = {
-        "role": role,
-        "type": type
-    }
-    if email_address:
-        json_data["emailAddress"] = email_address
-    if domain:
-        json_data["domain"] = domain
+    params = drop_unset(
+        emailMessage=email_message,
+        moveToNewOwnersRoot=move_to_new_owners_root,
+        sendNotificationEmail=send_notification_email,
+        supportsAllDrives=supports_all_drives,
+        transferOwnership=transfer_ownership,
+        useDomainAdminAccess=use_domain_admin_access
+    )
+    
+    json_data = drop_unset(
+        role=role,
+        type=type,
+        emailAddress=email_address,
+        domain=domain
+    )
+    
+    endpoint = drive_path(PERMISSIONS_PATH, file_id)
+    return await make_api_request("POST", endpoint, params=params, json_data=json_data)
+
+@mcp.tool()
+async def permissions_bulk_create(
+    operations: List[PermissionCreate]
+) -> BatchResponse:
+    """Creates many permissions (e.g. sharing many files) through Drive batch requests instead of one HTTP call each. Responses come back in the order of operations."""
+    sub_requests = [
+        SubRequest(
+            method="POST",
+            endpoint=drive_path(PERMISSIONS_PATH, operation.file_id),
+            params=drop_unset(
+                emailMessage=operation.email_message,
+                sendNotificationEmail=operation.send_notification_email,
+                supportsAllDrives=operation.supports_all_drives,
+                transferOwnership=operation.transfer_ownership
+            ),
+            json_data=drop_unset(
+                role=operation.role,
+                type=operation.type,
+                emailAddress=operation.email_address,
+                domain=operation.domain
+            )
+        )
+        for operation in operations
+    ]
     
-    endpoint = f"/drive/v3/files/{file_id}/permissions"
-    return make_api_request("POST", endpoint, params=params, json_data=json_data)
+    return BatchResponse(responses=await execute_batch(sub_requests))
 
 @mcp.tool()
-def permissions_delete(
+async def permissions_delete(
     file_id: str,
     permission_id: str,
     supports_all_drives: Optional[bool] = None,
     use_domain_admin_access: Optional[bool] = None
 ) -> APIResponse:
     """Deletes a permission."""
-    params = {}
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    if use_domain_admin_access is not None:
-        params["useDomainAdminAccess"] = use_domain_admin_access
+    params = drop_unset(
+        supportsAllDrives=supports_all_drives,
+        useDomainAdminAccess=use_domain_admin_access
+    )
     
-    endpoint = f"/drive/v3/files/{file_id}/permissions/{permission_id}"
-    return make_api_request("DELETE", endpoint, params=params)
+    endpoint = drive_path(PERMISSION_PATH, file_id, permission_id)
+    return await make_api_request("DELETE", endpoint, params=params)
 
 @mcp.tool()
-def permissions_get(
+async def permissions_get(
     file_id: str,
     permission_id: str,
     supports_all_drives: Optional[bool] = None,
     use_domain_admin_access: Optional[bool] = None
 ) -> APIResponse:
     """Gets a permission by ID."""
-    params = {}
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    if use_domain_admin_access is not None:
-        params["useDomainAdminAccess"] = use_domain_admin_access
+    params = drop_unset(
+        supportsAllDrives=supports_all_drives,
+        useDomainAdminAccess=use_domain_admin_access
+    )
     
-    endpoint = f"/drive/v3/files/{file_id}/permissions/{permission_id}"
-    return make_api_request("GET", endpoint, params=params)
+    endpoint = drive_path(PERMISSION_PATH, file_id, permission_id)
+    return await make_api_request("GET", endpoint, params=params, cache_ttl=CACHE_TTL_SHORT)
 
 @mcp.tool()
-def permissions_list(
+async def permissions_list(
     file_id: str,
     page_size: Optional[int] = None,
     page_token: Optional[str] = None,
     supports_all_drives: Optional[bool] = None,
-    use_domain_admin_access: Optional[bool] = None
+    use_domain_admin_access: Optional[bool] = None,
+    fields: Optional[str] = None
 ) -> PermissionList:
-    """Lists a file's or shared drive's permissions."""
-    params = {}
-    if page_size:
-        params["pageSize"] = page_size
-    if page_token:
-        params["pageToken"] = page_token
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    if use_domain_admin_access is not None:
-        params["useDomainAdminAccess"] = use_domain_admin_access
-    
-    endpoint = f"/drive/v3/files/{file_id}/permissions"
-    response = make_api_request("GET", endpoint, params=params)
+    """Lists a file's or shared drive's permissions. Pass fields to override the default partial-response mask. To detect changes, poll changes_list rather than re-listing permissions per file."""
+    params = drop_unset(
+        fields=fields or DEFAULT_PERMISSION_LIST_FIELDS,
+        pageSize=page_size,
+        pageToken=page_token,
+        supportsAllDrives=supports_all_drives,
+        useDomainAdminAccess=use_domain_admin_access
+    )
+    
+    endpoint = drive_path(PERMISSIONS_PATH, file_id)
+    response = await make_api_request(
+        "GET",
+        endpoint,
+        params=params,
+        cache_ttl=CACHE_TTL_SHORT,
+        decoder=_PERMISSION_PAGE_ADAPTER
+    )
     
     if response.success and response.data:
         return PermissionList(
-            permissions=[Permission(**item) for item in response.data.get("permissions", [])],
+            permissions=_PERMISSIONS_ADAPTER.validate_python(response.data.get("permissions", [])),
             nextPageToken=response.data.get("nextPageToken")
         )
     else:
         return PermissionList()
 
 @mcp.tool()
-def permissions_update(
+async def permissions_list_all(
+    file_id: str,
+    supports_all_drives: Optional[bool] = None,
+    use_domain_admin_access: Optional[bool] = None,
+    fields: Optional[str] = None,
+    max_pages: int = MAX_LIST_ALL_PAGES
+) -> PermissionList:
+    """Lists all of a file's or shared drive's permissions in one call, following pagination server-side. Pass fields to override the default partial-response mask."""
+    params = drop_unset(
+        fields=with_page_tokens(fields or DEFAULT_PERMISSION_LIST_FIELDS),
+        pageSize=100,
+        supportsAllDrives=supports_all_drives,
+        useDomainAdminAccess=use_domain_admin_access
+    )
+    
+    endpoint = drive_path(PERMISSIONS_PATH, file_id)
+    items, last_page = await fetch_all_pages(endpoint, params, "permissions", max_pages)
+    
+    return PermissionList(
+        permissions=_PERMISSIONS_ADAPTER.validate_python(items),
+        nextPageToken=last_page.get("nextPageToken")
+    )
+
+@mcp.tool()
+async def permissions_update(
     file_id: str,
     permission_id: str,
     role: Optional[str] = None,
@@ -1161,26 +2377,21 @@ def permissions_update(
     use_domain_admin_access: Optional[bool] = None
 ) -> APIResponse:
     """Updates a permission with patch semantics."""
-    params = {}
-    if remove_expiration is not None:
-        params["removeExpiration"] = remove_expiration
-    if supports_all_drives is not None:
-        params["supportsAllDrives"] = supports_all_drives
-    if transfer_ownership is not None:
-        params["transferOwnership"] = transfer_ownership
-    if use_domain_admin_access is not None:
-        params["useDomainAdminAccess"] = use_domain_admin_access
-    
-    json_data = {}
-    if role:
-        json_data["role"] = role
-    
-    endpoint = f"/drive/v3/files/{file_id}/permissions/{permission_id}"
-    return make_api_request("PATCH", endpoint, params=params, json_data=json_data)
+    params = drop_unset(
+        removeExpiration=remove_expiration,
+        supportsAllDrives=supports_all_drives,
+        transferOwnership=transfer_ownership,
+        useDomainAdminAccess=use_domain_admin_access
+    )
+    
+    json_data = drop_unset(role=role)
+    
+    endpoint = drive_path(PERMISSION_PATH, file_id, permission_id)
+    return await make_api_request("PATCH", endpoint, params=params, json_data=json_data)
 
 # Replies resource tools
 @mcp.tool()
-def replies_create(
+async def replies_create(
     file_id: str,
     comment_id: str,
     content: str
@@ -1188,64 +2399,68 @@ def replies_create(
     """Creates a reply to a comment."""
     json_data = {"content": content}
     
-    endpoint = f"/drive/v3/files/{file_id}/comments/{comment_id}/replies"
-    return make_api_request("POST", endpoint, json_data=json_data)
+    endpoint = drive_path(REPLIES_PATH, file_id, comment_id)
+    return await make_api_request("POST", endpoint, json_data=json_data)
 
 @mcp.tool()
-def replies_delete(
+async def replies_delete(
     file_id: str,
     comment_id: str,
     reply_id: str
 ) -> APIResponse:
     """Deletes a reply."""
-    endpoint = f"/drive/v3/files/{file_id}/comments/{comment_id}/replies/{reply_id}"
-    return make_api_request("DELETE", endpoint)
+    endpoint = drive_path(REPLY_PATH, file_id, comment_id, reply_id)
+    return await make_api_request("DELETE", endpoint)
 
 @mcp.tool()
-def replies_get(
+async def replies_get(
     file_id: str,
     comment_id: str,
     reply_id: str,
     include_deleted: Optional[bool] = None
 ) -> APIResponse:
     """Gets a reply by ID."""
-    params = {}
-    if include_deleted is not None:
-        params["includeDeleted"] = include_deleted
+    params = drop_unset(includeDeleted=include_deleted)
     
-    endpoint = f"/drive/v3/files/{file_id}/comments/{comment_id}/replies/{reply_id}"
-    return make_api_request("GET", endpoint, params=params)
+    endpoint = drive_path(REPLY_PATH, file_id, comment_id, reply_id)
+    return await make_api_request("GET", endpoint, params=params, cache_ttl=CACHE_TTL_SHORT)
 
 @mcp.tool()
-def replies_list(
+async def replies_list(
     file_id: str,
     comment_id: str,
     include_deleted: Optional[bool] = None,
     page_size: Optional[int] = None,
-    page_token: Optional[str] = None
+    page_token: Optional[str] = None,
+    fields: Optional[str] = None
 ) -> ReplyList:
-    """Lists a comment's replies."""
-    params = {}
-    if include_deleted is not None:
-        params["includeDeleted"] = include_deleted
-    if page_size:
-        params["pageSize"] = page_size
-    if page_token:
-        params["pageToken"] = page_token
-    
-    endpoint = f"/drive/v3/files/{file_id}/comments/{comment_id}/replies"
-    response = make_api_request("GET", endpoint, params=params)
+    """Lists a comment's replies. Pass fields to override the default partial-response mask."""
+    params = drop_unset(
+        fields=fields or DEFAULT_REPLY_LIST_FIELDS,
+        includeDeleted=include_deleted,
+        pageSize=page_size,
+        pageToken=page_token
+    )
+    
+    endpoint = drive_path(REPLIES_PATH, file_id, comment_id)
+    response = await make_api_request(
+        "GET",
+        endpoint,
+        params=params,
+        cache_ttl=CACHE_TTL_SHORT,
+        decoder=_REPLY_PAGE_ADAPTER
+    )
     
     if response.success and response.data:
         return ReplyList(
-            replies=[Reply(**item) for item in response.data.get("replies", [])],
+            replies=_REPLIES_ADAPTER.validate_python(response.data.get("replies", [])),
             nextPageToken=response.data.get("nextPageToken")
         )
     else:
         return ReplyList()
 
 @mcp.tool()
-def replies_update(
+async def replies_update(
     file_id: str,
     comment_id: str,
     reply_id: str,
@@ -1254,59 +2469,97 @@ def replies_update(
     """Updates a reply with patch semantics."""
     json_data = {"content": content}
     
-    endpoint = f"/drive/v3/files/{file_id}/comments/{comment_id}/replies/{reply_id}"
-    return make_api_request("PATCH", endpoint, json_data=json_data)
+    endpoint = drive_path(REPLY_PATH, file_id, comment_id, reply_id)
+    return await make_api_request("PATCH", endpoint, json_data=json_data)
 
 # Revisions resource tools
 @mcp.tool()
-def revisions_delete(
+async def revisions_delete(
     file_id: str,
     revision_id: str
 ) -> APIResponse:
     """Permanently deletes a file version."""
-    endpoint = f"/drive/v3/files/{file_id}/revisions/{revision_id}"
-    return make_api_request("DELETE", endpoint)
+    endpoint = drive_path(REVISION_PATH, file_id, revision_id)
+    return await make_api_request("DELETE", endpoint)
 
 @mcp.tool()
-def revisions_get(
+async def revisions_download(
+    file_id: str,
+    revision_id: str,
+    destination_path: str,
+    acknowledge_abuse: Optional[bool] = None
+) -> APIResponse:
+    """Streams a revision's content to a local file without loading it into memory, returning its path, size and MIME type."""
+    params = drop_unset(
+        alt="media",
+        acknowledgeAbuse=acknowledge_abuse
+    )
+    
+    endpoint = drive_path(REVISION_PATH, file_id, revision_id)
+    return await download_to_file(endpoint, destination_path, params=params)
+
+@mcp.tool()
+async def revisions_get(
     file_id: str,
     revision_id: str,
     acknowledge_abuse: Optional[bool] = None
 ) -> APIResponse:
     """Gets a revision's metadata or content by ID."""
-    params = {}
-    if acknowledge_abuse is not None:
-        params["acknowledgeAbuse"] = acknowledge_abuse
+    params = drop_unset(acknowledgeAbuse=acknowledge_abuse)
     
-    endpoint = f"/drive/v3/files/{file_id}/revisions/{revision_id}"
-    return make_api_request("GET", endpoint, params=params)
+    endpoint = drive_path(REVISION_PATH, file_id, revision_id)
+    return await make_api_request("GET", endpoint, params=params, cache_ttl=CACHE_TTL_NORMAL)
 
 @mcp.tool()
-def revisions_list(
+async def revisions_bulk_get(
+    file_id: str,
+    revision_ids: List[str],
+    acknowledge_abuse: Optional[bool] = None
+) -> BatchResponse:
+    """Gets the metadata of several revisions of a file concurrently. Responses come back in the order of revision_ids."""
+    semaphore = asyncio.Semaphore(BULK_GET_CONCURRENCY)
+    
+    async def get_revision(revision_id: str) -> APIResponse:
+        async with semaphore:
+            return await revisions_get(file_id, revision_id, acknowledge_abuse)
+    
+    responses = await asyncio.gather(*(get_revision(revision_id) for revision_id in revision_ids))
+    return BatchResponse(responses=list(responses))
+
+@mcp.tool()
+async def revisions_list(
     file_id: str,
     page_size: Optional[int] = None,
-    page_token: Optional[str] = None
+    page_token: Optional[str] = None,
+    fields: Optional[str] = None
 ) -> RevisionList:
-    """Lists a file's revisions."""
-    params = {}
-    if page_size:
-        params["pageSize"] = page_size
-    if page_token:
-        params["pageToken"] = page_token
-    
-    endpoint = f"/drive/v3/files/{file_id}/revisions"
-    response = make_api_request("GET", endpoint, params=params)
+    """Lists a file's revisions. Pass fields to override the default partial-response mask. To detect changes, poll changes_list rather than re-listing revisions per file."""
+    params = drop_unset(
+        fields=fields or DEFAULT_REVISION_LIST_FIELDS,
+        pageSize=page_size,
+        pageToken=page_token
+    )
+    
+    endpoint = drive_path(REVISIONS_PATH, file_id)
+    response = await make_api_request(
+        "GET",
+        endpoint,
+        params=params,
+        cache_ttl=CACHE_TTL_NORMAL,
+        decoder=_REVISION_PAGE_ADAPTER,
+        stale_if_error=True
+    )
     
     if response.success and response.data:
         return RevisionList(
-            revisions=[Revision(**item) for item in response.data.get("revisions", [])],
+            revisions=_REVISIONS_ADAPTER.validate_python(response.data.get("revisions", [])),
             nextPageToken=response.data.get("nextPageToken")
         )
     else:
         return RevisionList()
 
 @mcp.tool()
-def revisions_update(
+async def revisions_update(
     file_id: str,
     revision_id: str,
     keep_forever: Optional[bool] = None,
@@ -1314,20 +2567,73 @@ def revisions_update(
     published_outside_domain: Optional[bool] = None
 ) -> APIResponse:
     """Updates a revision with patch semantics."""
-    json_data = {}
-    if keep_forever is not None:
-        json_data["keepForever"] = keep_forever
-    if published is not None:
-        json_data["published"] = published
-    if published_outside_domain is not None:
-        json_data["publishedOutsideDomain"] = published_outside_domain
-    
-    endpoint = f"/drive/v3/files/{file_id}/revisions/{revision_id}"
-    return make_api_request("PATCH", endpoint, json_data=json_data)
-
-def main():
+    json_data = drop_unset(
+        keepForever=keep_forever,
+        published=published,
+        publishedOutsideDomain=published_outside_domain
+    )
+    
+    endpoint = drive_path(REVISION_PATH, file_id, revision_id)
+    return await make_api_request("PATCH", endpoint, json_data=json_data)
+
+# Batch tools
+@mcp.tool()
+async def drive_batch(
+    sub_requests: List[SubRequest]
+) -> BatchResponse:
+    """Runs many non-media Drive API calls (method, endpoint path such as /drive/v3/files/{id}, params, json_data) as multipart batch requests, returning their responses in order."""
+    return BatchResponse(responses=await execute_batch(sub_requests))
+
+async def run_tool_call(tool_call: ToolCall) -> ToolCallResult:
+    """Run one of this server's tools by name, capturing any error"""
+    tool = mcp._tool_manager.get_tool(tool_call.name)
+    if tool is None or tool_call.name in ("drive_batch", "drive_batch_tools"):
+        return ToolCallResult(name=tool_call.name, error=f"Unknown or unbatchable tool: {tool_call.name}")
+    
+    try:
+        result = await tool.run(tool_call.arguments)
+    except Exception as e:
+        return ToolCallResult(name=tool_call.name, error=str(e))
+    return ToolCallResult(name=tool_call.name, result=result)
+
+@mcp.tool()
+async def drive_batch_tools(
+    tool_calls: List[ToolCall]
+) -> ToolCallResultList:
+    """Runs several of this server's tools (name plus arguments each) together, sending their Drive API calls as shared batch requests instead of one HTTP round trip each. Results come back in order."""
+    async with BatchContext() as batch:
+        tasks = [batch.run(run_tool_call(tool_call)) for tool_call in tool_calls]
+    
+    return ToolCallResultList(results=[task.result() for task in tasks])
+
+def create_http_app():
+    """Build the streamable HTTP app in a worker process.
+
+    Sessions are stateless so any worker can serve any request.
+    """
+    mcp.settings.stateless_http = True
+    return mcp.streamable_http_app()
+
+def main() -> None:
     """Main entry point for the MCP server."""
-    mcp.run()
+    # Fail at startup rather than on the first tool call if Nango isn't configured
+    get_nango_config()
+    
+    if MCP_TRANSPORT == "streamable-http" and MCP_WORKERS > 1:
+        if not REDIS_URL:
+            print(
+                f"Warning: running {MCP_WORKERS} workers without REDIS_URL; each worker keeps its own response cache",
+                file=sys.stderr
+            )
+        uvicorn.run(
+            "main:create_http_app",
+            factory=True,
+            host=mcp.settings.host,
+            port=mcp.settings.port,
+            workers=MCP_WORKERS
+        )
+    else:
+        mcp.run(transport=MCP_TRANSPORT)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file